@@ -4,29 +4,26 @@ Different AI strategies for testing game balance
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from collections import OrderedDict
+import copy
+from dataclasses import fields
+from itertools import chain
+from operator import attrgetter, mul
+from typing import Callable, Dict, List, Optional, Tuple
 import random
-from game_state import Player, Card, CardType, TerrainType, PlayMode, ActionType, Rider
-from game_engine import GameEngine, Move
+from game_state import (GameState, Player, Card, CardType, TerrainType, PlayMode, ActionType, Rider,
+                        DRAFT_ACTIONS, FREE_ACTIONS, PULL_ACTIONS, TEAM_ACTIONS)
+from game_engine import GameEngine, Move, TERRAIN_LIMIT_TABLE
 
 
 def calculate_move_distance(engine: GameEngine, move: Move) -> int:
-    """Helper function to calculate how far a move will advance a rider"""
-    if move.action_type == ActionType.PULL:
-        return engine._calculate_pull_movement(move.rider, move.cards)
-    elif move.action_type == ActionType.ATTACK:
-        return engine._calculate_attack_movement(move.rider, move.cards)
-    elif move.action_type == ActionType.TEAM_PULL:
-        return engine._calculate_pull_movement(move.rider, move.cards)
-    elif move.action_type == ActionType.DRAFT:
-        if engine.state.last_move:
-            return engine.state.last_move.get('movement', 0)
-        return 0
-    elif move.action_type == ActionType.TEAM_DRAFT:
-        if engine.state.last_move:
-            return engine.state.last_move.get('movement', 0)
-        return 0
-    return 0
+    """Helper function to calculate how far a move will advance a rider
+
+    Moves from engine.get_valid_moves() carry this precomputed as move.distance.
+    """
+    if move.distance is not None:
+        return move.distance
+    return engine._calculate_move_distance(move)
 
 
 def calculate_total_advancement(engine: GameEngine, move: Move) -> int:
@@ -35,32 +32,12 @@ def calculate_total_advancement(engine: GameEngine, move: Move) -> int:
     For single rider moves (Pull, Attack, Draft): returns distance moved
     For team moves (TeamPull, TeamDraft): returns distance × number of riders
     For TeamCar: returns 0 (no advancement)
+
+    Moves from engine.get_valid_moves() carry this precomputed as move.advancement.
     """
-    if move.action_type == ActionType.PULL:
-        return engine._calculate_pull_movement(move.rider, move.cards)
-    elif move.action_type == ActionType.ATTACK:
-        return engine._calculate_attack_movement(move.rider, move.cards)
-    elif move.action_type == ActionType.DRAFT:
-        # Draft copies movement from last move
-        if engine.state.last_move:
-            return engine.state.last_move.get('movement', 0)
-        return 0
-    elif move.action_type == ActionType.TEAM_PULL:
-        # TeamPull: lead rider + all drafting riders move same distance
-        distance = engine._calculate_pull_movement(move.rider, move.cards)
-        num_riders = 1 + len(move.drafting_riders)  # lead + drafters
-        return distance * num_riders
-    elif move.action_type == ActionType.TEAM_DRAFT:
-        # TeamDraft: all riders move same distance
-        if engine.state.last_move:
-            distance = engine.state.last_move.get('movement', 0)
-            num_riders = 1 + len(move.drafting_riders)  # primary + drafters
-            return distance * num_riders
-        return 0
-    elif move.action_type == ActionType.TEAM_CAR:
-        return 0  # No advancement
-    
-    return 0
+    if move.advancement is not None:
+        return move.advancement
+    return engine._calculate_advancement(move)
 
 
 def should_use_team_car(player: Player, valid_moves: List[Move], hand_threshold: int = 3) -> bool:
@@ -75,12 +52,53 @@ def should_use_team_car(player: Player, valid_moves: List[Move], hand_threshold:
         return False
 
     # Check if Draft or TeamDraft moves are available
-    has_draft = any(m.action_type in [ActionType.DRAFT, ActionType.TEAM_DRAFT] for m in valid_moves)
+    has_draft = any(m.action_type.bit & DRAFT_ACTIONS for m in valid_moves)
 
     # Only use TeamCar if no draft moves available
     return not has_draft
 
 
+def may_cross_scoring_position(state: GameState, move: Move, distance: int) -> bool:
+    """Whether a sprint or finish lies within distance of one of the move's riders
+
+    A cheap gate for point estimates: terrain limits only shorten moves, so a
+    move that fails it cannot score.
+    """
+    lowest = highest = move.rider.position
+    for drafter in move.drafting_riders:
+        position = drafter.position
+        if position < lowest:
+            lowest = position
+        elif position > highest:
+            highest = position
+    return bool(state.scoring_positions_crossed(lowest, highest + distance))
+
+
+def sprint_points_won(state: GameState, rider: Rider, old_pos: int, new_pos: int,
+                      finish_weight: float = 1) -> float:
+    """Sprint and finish points rider would win moving from old_pos to new_pos
+
+    Fields where the rider has already arrived are skipped. Finish points are
+    multiplied by finish_weight.
+    """
+    points = 0
+    track = state.track
+    sprint_arrivals = state.sprint_arrivals
+    sprint_arrival_bits = state.sprint_arrival_bits
+    rider_bit = rider.bit
+    for pos in state.scoring_positions_crossed(old_pos, new_pos):
+        tile = track[pos]
+        current_rank = len(sprint_arrivals.get(pos, ()))
+        if (not tile.sprint_points or current_rank >= len(tile.sprint_points)
+                or sprint_arrival_bits.get(pos, 0) & rider_bit):
+            continue
+        if tile.terrain == TerrainType.FINISH:
+            points += tile.sprint_points[current_rank] * finish_weight
+        else:
+            points += tile.sprint_points[current_rank]
+    return points
+
+
 def filter_wasteful_moves(moves: List[Move], engine: GameEngine) -> List[Move]:
     """Filter out moves that cost cards but have 0 advancement
 
@@ -98,54 +116,108 @@ def filter_wasteful_moves(moves: List[Move], engine: GameEngine) -> List[Move]:
     Returns:
         Filtered list of moves (preferring productive > free > wasteful)
     """
+    # Free moves (Draft, TeamDraft, TeamCar, or anything without cards) are only
+    # needed when nothing is productive, so they're collected in a second pass
     productive_moves = []  # Moves with advancement > 0
-    free_moves = []  # Draft, TeamDraft, TeamCar
-    wasteful_moves = []  # Moves costing cards with 0 advancement
+    has_free_moves = False
 
     for move in moves:
-        # Categorize each move
-        if move.action_type in [ActionType.DRAFT, ActionType.TEAM_DRAFT, ActionType.TEAM_CAR]:
-            free_moves.append(move)
-        elif len(move.cards) > 0:
-            advancement = calculate_total_advancement(engine, move)
-            if advancement > 0:
-                productive_moves.append(move)
-            else:
-                wasteful_moves.append(move)
-        else:
-            # Shouldn't happen, but treat as free
-            free_moves.append(move)
+        if move.action_type.bit & FREE_ACTIONS or not move.cards:
+            has_free_moves = True
+        elif calculate_total_advancement(engine, move) > 0:
+            productive_moves.append(move)
 
     # Return productive moves if available
     if productive_moves:
         return productive_moves
 
     # Otherwise return free moves if available (better than wasteful)
-    if free_moves:
-        return free_moves
+    if has_free_moves:
+        return [m for m in moves if m.action_type.bit & FREE_ACTIONS or not m.cards]
 
     # Last resort: return original moves (all are wasteful or empty)
     return moves
 
 
+def scoring_moves_by_points(valid_moves: List[Move], engine: GameEngine,
+                           points_fn: Callable[[Move, GameEngine], float]) -> Tuple[List[Move], Dict[int, float]]:
+    """Moves that score points per points_fn(move, engine), and each move's points by id(move)
+
+    TeamCar moves are skipped. Points only depend on the riders moved and the
+    base distance, so moves sharing those (card combinations with the same
+    total) are scored once, and only if a sprint or finish is within reach.
+    """
+    scoring_moves = []
+    points_by_move = {}
+    memo = {}
+    for move in valid_moves:
+        if move.action_type is ActionType.TEAM_CAR:
+            continue
+        distance = calculate_move_distance(engine, move)
+        key = (id(move.rider), distance, tuple(map(id, move.drafting_riders)))
+        points = memo.get(key)
+        if points is None:
+            if may_cross_scoring_position(engine.state, move, distance):
+                points = points_fn(move, engine)
+            else:
+                points = 0
+            memo[key] = points
+        if points > 0:
+            scoring_moves.append(move)
+            points_by_move[id(move)] = points
+    return scoring_moves, points_by_move
+
+
+def has_efficient_move(valid_moves: List[Move]) -> bool:
+    """Whether any non-TeamCar move advances at least one field per card used
+
+    Free moves count as efficient as long as they advance at all.
+    """
+    for move in valid_moves:
+        if move.action_type is ActionType.TEAM_CAR:
+            continue
+        advancement = move.advancement
+        if advancement > 0 and advancement >= len(move.cards):
+            return True
+    return False
+
+
 def get_best_draft_move(valid_moves: List[Move]) -> Optional[Move]:
     """Get the best draft move, prioritizing TeamDraft over Draft
     
     Returns:
         TeamDraft if available, otherwise Draft, otherwise None
     """
-    # Prefer TeamDraft (multiple riders move for free)
-    team_drafts = [m for m in valid_moves if m.action_type == ActionType.TEAM_DRAFT]
-    if team_drafts:
-        # Choose TeamDraft with most riders
-        return max(team_drafts, key=lambda m: 1 + len(m.drafting_riders))
-    
-    # Fall back to regular Draft
-    drafts = [m for m in valid_moves if m.action_type == ActionType.DRAFT]
-    if drafts:
-        return drafts[0]
-    
-    return None
+    best_team_draft = None
+    first_draft = None
+    for move in valid_moves:
+        if move.action_type is ActionType.TEAM_DRAFT:
+            # Choose TeamDraft with most riders (the first one on ties)
+            if best_team_draft is None or len(move.drafting_riders) > len(best_team_draft.drafting_riders):
+                best_team_draft = move
+        elif move.action_type is ActionType.DRAFT and first_draft is None:
+            first_draft = move
+
+    # Prefer TeamDraft (multiple riders move for free), then fall back to regular Draft
+    if best_team_draft is not None:
+        return best_team_draft
+    return first_draft
+
+
+def get_low_hand_move(engine: GameEngine, player: Player, valid_moves: List[Move],
+                      eligible_riders: List[Rider] = None) -> Optional[Move]:
+    """The move to play when the hand is low (< 3 cards), else None
+
+    Returns the best draft move (see get_best_draft_move) if there is one,
+    otherwise the TeamCar move.
+    """
+    if len(player.hand) >= 3:
+        return None
+    draft_move = get_best_draft_move(valid_moves)
+    if draft_move:
+        return draft_move
+    # No draft available, use TeamCar
+    return engine.team_car_move_if_needed(player, eligible_riders)
 
 
 def choose_card_to_discard(player: Player, engine: 'GameEngine' = None) -> Optional[Card]:
@@ -169,44 +241,51 @@ def choose_card_to_discard(player: Player, engine: 'GameEngine' = None) -> Optio
         return next(c for c in player.hand if c.card_type == most_common)
 
     finish_pos = engine.state.track_length - 1
-    finished_rider_types = set()
+    finished_types_mask = 0  # OR of CardType.bit of the finished riders
     unfinished_riders = []
     for rider in player.riders:
         if rider.position >= finish_pos:
-            finished_rider_types.add(rider.rider_type)
+            finished_types_mask |= rider.rider_type.bit
         else:
             unfinished_riders.append(rider)
 
     # (1) Discard cards of finished riders first
-    finished_cards = [c for c in player.hand if c.card_type in finished_rider_types]
-    if finished_cards:
-        return finished_cards[0]
+    if finished_types_mask:
+        for card in player.hand:
+            if card.card_type.bit & finished_types_mask:
+                return card
 
-    # Remaining cards are all potentially useful — group by type
+    # Remaining cards are all potentially useful — group by type, keeping the
+    # first card of each type (types in order of first appearance in hand)
     counts = {}
+    first_cards = {}
     for card in player.hand:
-        counts[card.card_type] = counts.get(card.card_type, 0) + 1
+        card_type = card.card_type
+        if card_type in counts:
+            counts[card_type] += 1
+        else:
+            counts[card_type] = 1
+            first_cards[card_type] = card
 
     # (2) Find the card type(s) most present in hand
     max_count = max(counts.values())
     most_common_types = [ct for ct, n in counts.items() if n == max_count]
 
     if len(most_common_types) == 1:
-        return next(c for c in player.hand if c.card_type == most_common_types[0])
+        return first_cards[most_common_types[0]]
 
     # (3) Tie-break: least valuable to unfinished riders on their current terrain
     # For each tied card type, compute its max pull value across unfinished riders
     type_values = {}
+    movement_terrain = engine.state.movement_terrain
     for card_type in most_common_types:
         best_val = 0
-        sample_card = next(c for c in player.hand if c.card_type == card_type)
+        sample_card = first_cards[card_type]
         for rider in unfinished_riders:
             # A rider card can only be played by its matching rider (or Energy by any)
             if sample_card.is_energy_card() or card_type == rider.rider_type:
-                tile = engine.state.get_tile_at_position(rider.position)
-                if tile:
-                    val = sample_card.get_movement(tile.terrain, PlayMode.PULL)
-                    best_val = max(best_val, val)
+                val = sample_card.get_movement(movement_terrain[rider.position], PlayMode.PULL)
+                best_val = max(best_val, val)
         type_values[card_type] = best_val
 
     min_value = min(type_values.values())
@@ -214,12 +293,70 @@ def choose_card_to_discard(player: Player, engine: 'GameEngine' = None) -> Optio
 
     # (4) Final tie-break: random
     chosen_type = random.choice(least_valuable)
-    return next(c for c in player.hand if c.card_type == chosen_type)
+    return first_cards[chosen_type]
+
+
+class TurnContext:
+    """Per-decision data shared by the priority checks of one choose_move call
+
+    The productive moves (not TeamCar, advancement > 0) are grouped once, and
+    the riders-by-position index is built on first use.
+    """
+
+    __slots__ = ('engine', 'player', 'eligible_riders', 'valid_moves',
+                 'productive_moves', 'productive_by_action', '_riders_by_position',
+                 '_riders_by_side')
+
+    def __init__(self, engine: GameEngine, player: Player, valid_moves: List[Move],
+                 eligible_riders: List[Rider] = None):
+        self.engine = engine
+        self.player = player
+        self.eligible_riders = eligible_riders
+        self.valid_moves = valid_moves
+        self.productive_moves = []  # In valid-moves order
+        self.productive_by_action = {}
+        for move in valid_moves:
+            if move.action_type is not ActionType.TEAM_CAR and move.advancement > 0:
+                self.productive_moves.append(move)
+                self.productive_by_action.setdefault(move.action_type, []).append(move)
+        self._riders_by_position = None
+        self._riders_by_side = None
+
+    def productive(self, action_type: ActionType) -> List[Move]:
+        """The productive moves of the given action type, in valid-moves order"""
+        return self.productive_by_action.get(action_type, [])
+
+    @property
+    def riders_by_position(self) -> Dict[int, List[Rider]]:
+        """state.get_riders_by_position(), built once per decision"""
+        if self._riders_by_position is None:
+            self._riders_by_position = self.engine.state.get_riders_by_position()
+        return self._riders_by_position
+
+    @property
+    def riders_by_side(self) -> Tuple[Dict[int, List[Rider]], Dict[int, List[Rider]]]:
+        """The riders by position split into (own riders, opponent riders), built once per decision"""
+        if self._riders_by_side is None:
+            player_id = self.player.player_id
+            own_by_pos = {}
+            opp_by_pos = {}
+            for pos, riders in self.riders_by_position.items():
+                for rider in riders:
+                    side = own_by_pos if rider.player_id == player_id else opp_by_pos
+                    side.setdefault(pos, []).append(rider)
+            self._riders_by_side = (own_by_pos, opp_by_pos)
+        return self._riders_by_side
+
+    def team_car_move(self) -> Optional[Move]:
+        """The TeamCar move for this decision (None if there is none)"""
+        return self.engine.team_car_move(self.player, self.eligible_riders)
 
 
 class Agent(ABC):
     """Base class for AI agents"""
 
+    __slots__ = ('player_id', 'name')
+
     def __init__(self, player_id: int, name: str):
         self.player_id = player_id
         self.name = name
@@ -243,22 +380,31 @@ class Agent(ABC):
 class RandomAgent(Agent):
     """Agent that plays randomly - baseline for comparison"""
 
-    def __init__(self, player_id: int):
+    __slots__ = ('_rng',)
+
+    def __init__(self, player_id: int, seed: Optional[int] = None):
         super().__init__(player_id, "Random")
+        # Own RNG so a seed reproduces this agent's choices; unseeded agents draw
+        # their seed from the global RNG, so seeding `random` still reproduces a game
+        self._rng = random.Random(seed if seed is not None else random.getrandbits(64))
 
     def choose_move(self, engine: GameEngine, player: Player, eligible_riders: List[Rider] = None) -> Optional[Move]:
         """Choose a random valid move"""
         valid_moves = engine.get_valid_moves(player, eligible_riders)
         if not valid_moves:
             return None
+        if len(valid_moves) == 1:
+            return valid_moves[0]
         # Filter out wasteful moves (cost cards but 0 advancement)
         valid_moves = filter_wasteful_moves(valid_moves, engine)
-        return random.choice(valid_moves)
+        return self._rng.choice(valid_moves)
 
 
 class MarcSolerAgent(Agent):
     """Agent that always plays for maximum total advancement across all riders"""
 
+    __slots__ = ()
+
     def __init__(self, player_id: int):
         super().__init__(player_id, "Marc Soler")
 
@@ -267,19 +413,13 @@ class MarcSolerAgent(Agent):
         valid_moves = engine.get_valid_moves(player, eligible_riders)
         if not valid_moves:
             return None
+        if len(valid_moves) == 1:
+            return valid_moves[0]
         
         # If hand is low (< 3 cards), try Draft/TeamDraft first, then TeamCar
-        if len(player.hand) < 3:
-            # Check for draft moves
-            draft_move = get_best_draft_move(valid_moves)
-            if draft_move:
-                return draft_move
-            
-            # No draft available, use TeamCar
-            if should_use_team_car(player, valid_moves):
-                team_car_moves = [m for m in valid_moves if m.action_type == ActionType.TEAM_CAR]
-                if team_car_moves:
-                    return team_car_moves[0]
+        low_hand_move = get_low_hand_move(engine, player, valid_moves, eligible_riders)
+        if low_hand_move:
+            return low_hand_move
 
         # Calculate total advancement for all moves and choose maximum
         # This considers both distance and number of riders moved
@@ -287,9 +427,9 @@ class MarcSolerAgent(Agent):
         filtered_moves = filter_wasteful_moves(valid_moves, engine)
 
         # Prefer non-TeamCar moves if available
-        non_team_car = [m for m in filtered_moves if m.action_type != ActionType.TEAM_CAR]
+        non_team_car = [m for m in filtered_moves if m.action_type is not ActionType.TEAM_CAR]
         if non_team_car:
-            return max(non_team_car, key=lambda m: calculate_total_advancement(engine, m))
+            return max(non_team_car, key=attrgetter('advancement'))
 
         # Fallback to TeamCar or any move
         if filtered_moves:
@@ -308,73 +448,74 @@ class ClaudeBotAgent(Agent):
     6. Positional play: Positions for future drafting opportunities
     """
 
+    __slots__ = ()
+
     def __init__(self, player_id: int):
         super().__init__(player_id, "ClaudeBot")
-        # Import terrain limits for decision making
-        from game_engine import TERRAIN_LIMITS
-        self.terrain_limits = TERRAIN_LIMITS
 
     def choose_move(self, engine: GameEngine, player: Player, eligible_riders: List[Rider] = None) -> Optional[Move]:
         """Choose the best move using a multi-factor scoring system"""
         valid_moves = engine.get_valid_moves(player, eligible_riders)
         if not valid_moves:
             return None
+        if len(valid_moves) == 1:
+            return valid_moves[0]
 
         # Filter out moves that cost cards but have 0 advancement
         valid_moves = filter_wasteful_moves(valid_moves, engine)
 
-        # Score all moves and pick the best
-        scored_moves = []
-        for move in valid_moves:
-            score = self._score_move(move, engine, player)
-            scored_moves.append((move, score))
-
-        # Return highest scored move
-        best_move = max(scored_moves, key=lambda x: x[1])
-        return best_move[0]
-
-    def _score_move(self, move: Move, engine: GameEngine, player: Player) -> float:
-        """Score a move based on multiple strategic factors"""
-        score = 0.0
-
+        # Values that are the same for every move this turn are computed once
+        team_car_score = self._score_team_car(player, engine)
+        hand_size = len(player.hand)
+        moving_riders = eligible_riders if eligible_riders is not None else player.riders
+        terrain_scores = {rider: self._score_terrain_matching(rider, engine) for rider in moving_riders}
+        riders_by_position = engine.state.get_riders_by_position()
+        movement_scores = {}  # See _score_move
+
+        # Score all moves and return the highest scored one (first one on ties)
+        scores = [self._score_move(move, engine, player, team_car_score, hand_size,
+                                   terrain_scores[move.rider], riders_by_position, movement_scores)
+                  for move in valid_moves]
+        return valid_moves[scores.index(max(scores))]
+
+    def _score_move(self, move: Move, engine: GameEngine, player: Player,
+                    team_car_score: float, hand_size: int, terrain_score: float,
+                    riders_by_position: Dict[int, List[Rider]], movement_scores: dict) -> float:
+        """Score a move based on multiple strategic factors
+
+        The movement factors only depend on which riders move and how far, which
+        many moves share (card combinations with the same total), so they are
+        computed once per turn for each (rider, base movement, drafters) in
+        movement_scores.
+        """
         # Handle TeamCar specially
-        if move.action_type == ActionType.TEAM_CAR:
-            return self._score_team_car(player, engine)
+        if move.action_type is ActionType.TEAM_CAR:
+            return team_car_score
 
-        # Calculate actual movement after terrain limits
         base_movement = self._get_base_movement(move, engine)
-        actual_movement = self._get_actual_movement(move, engine)
-
-        # FACTOR 1: Base advancement value (weighted by riders moved)
-        if move.action_type in [ActionType.TEAM_PULL, ActionType.TEAM_DRAFT]:
-            num_riders = 1 + len(move.drafting_riders)
-            # Calculate total team advancement with individual terrain limits
-            total_advancement = self._calculate_team_advancement(move, engine, base_movement)
-            score += total_advancement * 15
-        else:
-            score += actual_movement * 15
+        key = (id(move.rider), base_movement, tuple(map(id, move.drafting_riders)))
+        score = movement_scores.get(key)
+        if score is None:
+            score = movement_scores[key] = self._score_movement(move, engine, player, base_movement,
+                                                                riders_by_position)
 
         # FACTOR 2: Card efficiency (drafts are free!)
-        if move.action_type == ActionType.DRAFT:
+        if move.action_type is ActionType.DRAFT:
             score += 100  # Big bonus for free movement
-        elif move.action_type == ActionType.TEAM_DRAFT:
+        elif move.action_type is ActionType.TEAM_DRAFT:
             num_riders = 1 + len(move.drafting_riders)
             score += 100 + (num_riders - 1) * 50  # Even bigger for multiple free moves
-        elif move.action_type == ActionType.TEAM_PULL:
+        elif move.action_type is ActionType.TEAM_PULL:
             # Free movement for drafters, cost cards for puller
             free_riders = len(move.drafting_riders)
             score += free_riders * 40
 
-        # FACTOR 3: Sprint/Finish targeting
-        score += self._score_sprint_potential(move, engine, actual_movement)
-
         # FACTOR 4: Terrain-rider matching
-        score += self._score_terrain_matching(move, engine)
+        score += terrain_score
 
         # FACTOR 5: Card conservation (penalize using too many cards when not needed)
-        if move.action_type in [ActionType.PULL, ActionType.ATTACK, ActionType.TEAM_PULL]:
+        if move.action_type.bit & (PULL_ACTIONS | ActionType.ATTACK.bit):
             cards_used = len(move.cards)
-            hand_size = len(player.hand)
 
             # Penalize heavily if this would leave us with very few cards
             if hand_size - cards_used <= 1:
@@ -383,11 +524,37 @@ class ClaudeBotAgent(Agent):
                 score -= 20
 
             # Penalize attacks slightly (they use 3 cards)
-            if move.action_type == ActionType.ATTACK:
+            if move.action_type is ActionType.ATTACK:
                 score -= 15
 
+        return score
+
+    def _score_movement(self, move: Move, engine: GameEngine, player: Player, base_movement: int,
+                        riders_by_position: Dict[int, List[Rider]]) -> float:
+        """Score the factors that depend only on the riders moved and the distance"""
+        score = 0.0
+
+        # Calculate actual movement after terrain limits (each drafter has their own)
+        limited_movement = engine._calculate_limited_movement
+        start_pos = move.rider.position
+        actual_movement = limited_movement(move.rider, start_pos, base_movement)
+        drafter_movements = [limited_movement(drafter, drafter.position, base_movement)
+                             for drafter in move.drafting_riders]
+        dest_pos = min(start_pos + actual_movement, engine.state.track_length - 1)
+
+        # FACTOR 1: Base advancement value (weighted by riders moved)
+        if move.action_type.bit & TEAM_ACTIONS:
+            # Total team advancement with individual terrain limits
+            total_advancement = actual_movement + sum(drafter_movements)
+            score += total_advancement * 15
+        else:
+            score += actual_movement * 15
+
+        # FACTOR 3: Sprint/Finish targeting
+        score += self._score_sprint_potential(move, engine, base_movement, dest_pos, drafter_movements)
+
         # FACTOR 6: Positioning for future drafts
-        score += self._score_positioning(move, engine, player, actual_movement)
+        score += self._score_positioning(move, player, dest_pos, riders_by_position)
 
         # FACTOR 7: Avoid wasting movement on terrain-limited riders
         if actual_movement < base_movement:
@@ -403,115 +570,73 @@ class ClaudeBotAgent(Agent):
 
     def _get_base_movement(self, move: Move, engine: GameEngine) -> int:
         """Get base movement before terrain limits"""
-        if move.action_type == ActionType.PULL:
-            return engine._calculate_pull_movement(move.rider, move.cards)
-        elif move.action_type == ActionType.ATTACK:
-            return engine._calculate_attack_movement(move.rider, move.cards)
-        elif move.action_type == ActionType.DRAFT:
-            if engine.state.last_move:
-                return engine.state.last_move.get('movement', 0)
-            return 0
-        elif move.action_type == ActionType.TEAM_PULL:
-            return engine._calculate_pull_movement(move.rider, move.cards)
-        elif move.action_type == ActionType.TEAM_DRAFT:
-            if engine.state.last_move:
-                return engine.state.last_move.get('movement', 0)
-            return 0
-        return 0
-
-    def _get_actual_movement(self, move: Move, engine: GameEngine) -> int:
-        """Get actual movement after applying terrain limits for the primary rider"""
-        base = self._get_base_movement(move, engine)
-        return engine._calculate_limited_movement(move.rider, move.rider.position, base)
-
-    def _calculate_team_advancement(self, move: Move, engine: GameEngine, base_movement: int) -> int:
-        """Calculate total advancement for team moves, accounting for per-rider terrain limits"""
-        total = 0
-
-        # Primary rider
-        primary_movement = engine._calculate_limited_movement(
-            move.rider, move.rider.position, base_movement
-        )
-        total += primary_movement
+        return calculate_move_distance(engine, move)
 
-        # Drafting riders (each has their own terrain limits)
-        for drafter in move.drafting_riders:
-            drafter_movement = engine._calculate_limited_movement(
-                drafter, drafter.position, base_movement
-            )
-            total += drafter_movement
+    def _score_sprint_potential(self, move: Move, engine: GameEngine, base_movement: int,
+                                dest_pos: int, drafter_movements: List[int]) -> float:
+        """Score based on sprint/finish line potential
 
-        return total
+        dest_pos is where the moving rider ends up; drafter_movements holds the
+        limited movement of each of move.drafting_riders.
+        """
+        # Cheap gate: nothing to score unless a sprint or finish is within reach
+        state = engine.state
+        if not may_cross_scoring_position(state, move, base_movement):
+            return 0.0
 
-    def _score_sprint_potential(self, move: Move, engine: GameEngine, actual_movement: int) -> float:
-        """Score based on sprint/finish line potential"""
         score = 0.0
-        old_pos = move.rider.position
-        new_pos = min(old_pos + actual_movement, engine.state.track_length - 1)
+        track = state.track
+        track_end = state.track_length - 1
+        sprint_arrivals = state.sprint_arrivals
 
         # Check all positions crossed for sprints
-        for pos in range(old_pos + 1, new_pos + 1):
-            tile = engine.state.get_tile_at_position(pos)
-            if tile:
-                if tile.terrain == TerrainType.FINISH:
-                    # Huge bonus for finishing - check arrival order
-                    arrivals = engine.state.sprint_arrivals.get(pos, [])
-                    position_in_race = len(arrivals)
-                    # Points: [12, 8, 5, 3, 1] for top 5
-                    if position_in_race == 0:
-                        score += 200  # First to finish!
-                    elif position_in_race == 1:
-                        score += 150
-                    elif position_in_race == 2:
-                        score += 100
-                    elif position_in_race < 5:
-                        score += 50
-                elif tile.terrain == TerrainType.SPRINT:
-                    # Bonus for intermediate sprints
-                    arrivals = engine.state.sprint_arrivals.get(pos, [])
-                    position_in_sprint = len(arrivals)
-                    # Points: [3, 2, 1] for top 3
-                    if position_in_sprint == 0:
-                        score += 60
-                    elif position_in_sprint == 1:
-                        score += 40
-                    elif position_in_sprint == 2:
-                        score += 20
+        for pos in state.scoring_positions_crossed(move.rider.position, dest_pos):
+            terrain = track[pos].terrain
+            if terrain == TerrainType.FINISH:
+                # Huge bonus for finishing - check arrival order
+                position_in_race = len(sprint_arrivals.get(pos, ()))
+                # Points: [12, 8, 5, 3, 1] for top 5
+                if position_in_race == 0:
+                    score += 200  # First to finish!
+                elif position_in_race == 1:
+                    score += 150
+                elif position_in_race == 2:
+                    score += 100
+                elif position_in_race < 5:
+                    score += 50
+            elif terrain == TerrainType.SPRINT:
+                # Bonus for intermediate sprints
+                position_in_sprint = len(sprint_arrivals.get(pos, ()))
+                # Points: [3, 2, 1] for top 3
+                if position_in_sprint == 0:
+                    score += 60
+                elif position_in_sprint == 1:
+                    score += 40
+                elif position_in_sprint == 2:
+                    score += 20
 
         # Also check for drafting riders in team moves
-        if move.action_type in [ActionType.TEAM_PULL, ActionType.TEAM_DRAFT]:
-            base_movement = self._get_base_movement(move, engine)
-            for drafter in move.drafting_riders:
-                drafter_movement = engine._calculate_limited_movement(
-                    drafter, drafter.position, base_movement
-                )
+        if move.action_type.bit & TEAM_ACTIONS:
+            for drafter, drafter_movement in zip(move.drafting_riders, drafter_movements):
                 drafter_old = drafter.position
-                drafter_new = min(drafter_old + drafter_movement, engine.state.track_length - 1)
+                drafter_new = min(drafter_old + drafter_movement, track_end)
 
-                for pos in range(drafter_old + 1, drafter_new + 1):
-                    tile = engine.state.get_tile_at_position(pos)
-                    if tile and tile.terrain == TerrainType.FINISH:
-                        arrivals = engine.state.sprint_arrivals.get(pos, [])
-                        if len(arrivals) < 5:
+                for pos in state.scoring_positions_crossed(drafter_old, drafter_new):
+                    terrain = track[pos].terrain
+                    if terrain == TerrainType.FINISH:
+                        if len(sprint_arrivals.get(pos, ())) < 5:
                             score += 80  # Bonus for getting more riders to finish
-                    elif tile and tile.terrain == TerrainType.SPRINT:
-                        arrivals = engine.state.sprint_arrivals.get(pos, [])
-                        if len(arrivals) < 3:
+                    elif terrain == TerrainType.SPRINT:
+                        if len(sprint_arrivals.get(pos, ())) < 3:
                             score += 25
 
         return score
 
-    def _score_terrain_matching(self, move: Move, engine: GameEngine) -> float:
+    def _score_terrain_matching(self, rider: Rider, engine: GameEngine) -> float:
         """Score based on how well the rider matches the terrain"""
         score = 0.0
-        rider_type = move.rider.rider_type
-        current_terrain = engine._get_terrain_at_position(move.rider.position)
-
-        # Destination terrain analysis
-        base_movement = self._get_base_movement(move, engine)
-        actual_movement = self._get_actual_movement(move, engine)
-        dest_pos = min(move.rider.position + actual_movement, engine.state.track_length - 1)
-        dest_terrain = engine._get_terrain_at_position(dest_pos)
+        rider_type = rider.rider_type
+        current_terrain = engine.state.movement_terrain[rider.position]
 
         # Bonus for using the right rider on the right terrain
         if rider_type == CardType.CLIMBER and current_terrain == TerrainType.CLIMB:
@@ -524,27 +649,28 @@ class ClaudeBotAgent(Agent):
             score += 10  # Rouleurs are balanced, small bonus everywhere
 
         # Penalty for using terrain-limited riders on their weak terrain
-        limit_key = (rider_type, current_terrain)
-        if limit_key in self.terrain_limits:
+        if TERRAIN_LIMIT_TABLE[rider_type.index][current_terrain.index] is not None:
             score -= 15  # This rider is limited on this terrain
 
         return score
 
-    def _score_positioning(self, move: Move, engine: GameEngine, player: Player, actual_movement: int) -> float:
-        """Score based on positioning for future drafts"""
+    def _score_positioning(self, move: Move, player: Player, dest_pos: int,
+                           riders_by_position: Dict[int, List[Rider]]) -> float:
+        """Score based on positioning for future drafts (dest_pos is where the moving rider ends up)"""
         score = 0.0
-        dest_pos = min(move.rider.position + actual_movement, engine.state.track_length - 1)
+        rider = move.rider
+        player_id = player.player_id
 
         # Check if we end up next to other riders
-        riders_at_dest = engine.state.get_riders_at_position(dest_pos)
+        riders_at_dest = riders_by_position.get(dest_pos, [])
 
         # Bonus for being with opponent riders (drafting opportunity)
-        opponent_riders = [r for r in riders_at_dest if r.player_id != player.player_id]
+        opponent_riders = [r for r in riders_at_dest if r.player_id != player_id]
         if opponent_riders:
             score += len(opponent_riders) * 20
 
         # Bonus for being with own riders (team move opportunity)
-        own_riders = [r for r in riders_at_dest if r.player_id == player.player_id and r != move.rider]
+        own_riders = [r for r in riders_at_dest if r.player_id == player_id and r != rider]
         if own_riders:
             score += len(own_riders) * 15
 
@@ -574,12 +700,14 @@ class ClaudeBotAgent(Agent):
 
     def _get_rider_terrain_limit(self, rider_type: CardType, terrain: TerrainType) -> Optional[int]:
         """Get terrain limit for a rider type on a terrain, if any"""
-        return self.terrain_limits.get((rider_type, terrain))
+        return TERRAIN_LIMIT_TABLE[rider_type.index][terrain.index]
 
 
 class WheelsuckerAgent(Agent):
     """Agent that prioritizes drafting and positioning for future drafts"""
 
+    __slots__ = ()
+
     def __init__(self, player_id: int):
         super().__init__(player_id, "Wheelsucker")
 
@@ -591,103 +719,99 @@ class WheelsuckerAgent(Agent):
         valid_moves = engine.get_valid_moves(player, eligible_riders)
         if not valid_moves:
             return None
+        if len(valid_moves) == 1:
+            return valid_moves[0]
         
-        # Priority 1: TeamDraft with biggest total advancement (only if > 0)
-        team_draft_moves = [m for m in valid_moves if m.action_type == ActionType.TEAM_DRAFT]
-        if team_draft_moves:
-            best_team_draft = max(team_draft_moves, key=lambda m: calculate_total_advancement(engine, m))
-            if calculate_total_advancement(engine, best_team_draft) > 0:
-                return best_team_draft
-        
-        # Priority 2: Draft with biggest total advancement (only if > 0)
-        draft_moves = [m for m in valid_moves if m.action_type == ActionType.DRAFT]
-        if draft_moves:
-            best_draft = max(draft_moves, key=lambda m: calculate_total_advancement(engine, m))
-            if calculate_total_advancement(engine, best_draft) > 0:
-                return best_draft
-        
-        # Priority 3: TeamPull with biggest total advancement (only if > 0)
-        team_pull_moves = [m for m in valid_moves if m.action_type == ActionType.TEAM_PULL]
-        if team_pull_moves:
-            best_team_pull = max(team_pull_moves, key=lambda m: calculate_total_advancement(engine, m))
-            if calculate_total_advancement(engine, best_team_pull) > 0:
-                return best_team_pull
+        # Priorities 1-3: TeamDraft, then Draft, then TeamPull with the biggest
+        # total advancement (only if > 0)
+        for action_type in (ActionType.TEAM_DRAFT, ActionType.DRAFT, ActionType.TEAM_PULL):
+            moves = engine.action_moves(player, action_type, eligible_riders)
+            if moves:
+                best_move = max(moves, key=attrgetter('advancement'))
+                if best_move.advancement > 0:
+                    return best_move
         
         # Priority 4: Attack if it can win points (land on or cross sprint)
-        attack_moves = [m for m in valid_moves if m.action_type == ActionType.ATTACK]
-        if attack_moves:
-            for attack in attack_moves:
-                distance = engine._calculate_attack_movement(attack.rider, attack.cards)
-                old_pos = attack.rider.position
-                new_pos = min(old_pos + distance, engine.state.track_length - 1)
-                
-                # Check if any position crossed is a sprint or finish
-                for pos in range(old_pos + 1, new_pos + 1):
-                    tile = engine.state.get_tile_at_position(pos)
-                    if tile and tile.terrain in [TerrainType.SPRINT, TerrainType.FINISH]:
-                        # This attack can win points
-                        return attack
+        state = engine.state
+        track_end = state.track_length - 1
+        for attack in engine.action_moves(player, ActionType.ATTACK, eligible_riders):
+            old_pos = attack.rider.position
+            new_pos = min(old_pos + calculate_move_distance(engine, attack), track_end)
+
+            # Check if any position crossed is a sprint or finish
+            if state.scoring_positions_crossed(old_pos, new_pos):
+                # This attack can win points
+                return attack
         
+        (positioning_moves, rider_counts,
+         team_positioning_moves, team_rider_counts) = self._get_positioning_moves(valid_moves, engine, player)
+
         # Priority 5: Move to same field as opponent's rider (for future drafting)
-        positioning_moves = self._get_positioning_moves(valid_moves, engine, player, same_team=False)
         if positioning_moves:
             # Choose the one with most riders at destination (best drafting opportunity)
-            return max(positioning_moves, key=lambda m: self._count_riders_at_destination(m, engine, player))
+            return positioning_moves[rider_counts.index(max(rider_counts))]
         
         # Priority 6: Move to same field as own team rider (for TeamPull/TeamDraft)
-        team_positioning_moves = self._get_positioning_moves(valid_moves, engine, player, same_team=True)
         if team_positioning_moves:
-            return max(team_positioning_moves, key=lambda m: self._count_riders_at_destination(m, engine, player))
+            return team_positioning_moves[team_rider_counts.index(max(team_rider_counts))]
         
         # Priority 7: TeamCar
-        team_car_moves = [m for m in valid_moves if m.action_type == ActionType.TEAM_CAR]
-        if team_car_moves:
-            return team_car_moves[0]
+        team_car_move = engine.team_car_move(player, eligible_riders)
+        if team_car_move:
+            return team_car_move
         
         # Fallback: any move
         return valid_moves[0]
     
-    def _get_positioning_moves(self, valid_moves: List[Move], engine: GameEngine, 
-                               player: Player, same_team: bool) -> List[Move]:
-        """Get moves that position rider with other riders"""
+    def _get_positioning_moves(self, valid_moves: List[Move], engine: GameEngine,
+                               player: Player) -> Tuple[List[Move], List[int], List[Move], List[int]]:
+        """Get moves that position rider with other riders, in one pass over valid_moves
+
+        Returns the moves that reach a field with opponent riders and the moves
+        that reach a field with own team riders, each followed by how many riders
+        (opponents or teammates) other than the moving rider are at each move's
+        destination.
+        """
         positioning_moves = []
+        rider_counts = []
+        team_positioning_moves = []
+        team_rider_counts = []
+        riders_by_position = engine.state.get_riders_by_position()
+        track_end = engine.state.track_length - 1
+        player_id = player.player_id
         
         for move in valid_moves:
-            if move.action_type in [ActionType.TEAM_CAR]:
+            # Skip TeamCar and moves that don't advance
+            if move.action_type is ActionType.TEAM_CAR:
                 continue
-            
-            # Calculate destination
             distance = calculate_move_distance(engine, move)
-            if distance == 0:
+            if not distance:
                 continue
             
-            destination = min(move.rider.position + distance, engine.state.track_length - 1)
-            
             # Check if there are riders at destination
-            riders_at_dest = engine.state.get_riders_at_position(destination)
+            rider = move.rider
+            riders_at_dest = riders_by_position.get(min(rider.position + distance, track_end))
+            if not riders_at_dest:
+                continue
             
-            if same_team:
-                # Looking for own team riders
-                has_own_riders = any(r.player_id == player.player_id and r != move.rider 
-                                    for r in riders_at_dest)
-                if has_own_riders:
-                    positioning_moves.append(move)
-            else:
-                # Looking for opponent riders
-                has_opponent_riders = any(r.player_id != player.player_id 
-                                         for r in riders_at_dest)
-                if has_opponent_riders:
-                    positioning_moves.append(move)
+            has_opponent_riders = False
+            has_own_riders = False
+            count = 0  # Riders excluding the moving rider
+            for r in riders_at_dest:
+                if r.player_id != player_id:
+                    has_opponent_riders = True
+                elif r != rider:
+                    has_own_riders = True
+                if r != rider:
+                    count += 1
+            if has_opponent_riders:
+                positioning_moves.append(move)
+                rider_counts.append(count)
+            if has_own_riders:
+                team_positioning_moves.append(move)
+                team_rider_counts.append(count)
         
-        return positioning_moves
-    
-    def _count_riders_at_destination(self, move: Move, engine: GameEngine, player: Player) -> int:
-        """Count how many riders (opponents or teammates) are at the destination"""
-        distance = calculate_move_distance(engine, move)
-        destination = min(move.rider.position + distance, engine.state.track_length - 1)
-        riders_at_dest = engine.state.get_riders_at_position(destination)
-        # Count riders excluding the moving rider
-        return len([r for r in riders_at_dest if r != move.rider])
+        return positioning_moves, rider_counts, team_positioning_moves, team_rider_counts
 
 
 class GeminiAgent(Agent):
@@ -701,6 +825,12 @@ class GeminiAgent(Agent):
     - Hand management (TeamCar)
     """
 
+    # Weights for the features returned by _move_features:
+    # (advancement, points, cards used, checkpoints)
+    FEATURE_WEIGHTS = (10.0, 50.0, -8.0, 15.0)
+
+    __slots__ = ()
+
     def __init__(self, player_id: int):
         super().__init__(player_id, "Gemini")
 
@@ -708,113 +838,80 @@ class GeminiAgent(Agent):
         valid_moves = engine.get_valid_moves(player, eligible_riders)
         if not valid_moves:
             return None
+        if len(valid_moves) == 1:
+            return valid_moves[0]
 
         # Filter out moves that cost cards but have 0 advancement
         valid_moves = filter_wasteful_moves(valid_moves, engine)
 
-        scored_moves = []
-        for move in valid_moves:
-            score = self._score_move(move, engine, player)
-            scored_moves.append((score, move))
-
-        # Sort by score descending
-        scored_moves.sort(key=lambda x: x[0], reverse=True)
-
-        best_move = scored_moves[0][1]
-
-        return best_move
-
-    def _score_move(self, move: Move, engine: GameEngine, player: Player) -> float:
-        score = 0.0
-
-        # 1. Handle TeamCar separately
-        if move.action_type == ActionType.TEAM_CAR:
-            # Base score for TeamCar is low, unless we really need cards
-            score = -20.0
-            # Bonus for low hand size
-            if len(player.hand) <= 2:
-                score += 60.0
-            elif len(player.hand) <= 3:
-                score += 30.0
-            return score
-
-        # 2. Calculate Advancement
-        advancement = calculate_total_advancement(engine, move)
-        score += advancement * 10.0
-
-        # 3. Calculate Points (Sprints/Finish)
-        points = self._estimate_points(move, engine)
-        score += points * 50.0
-
-        # 4. Card Efficiency (Penalize using cards)
-        cards_used = len(move.cards)
-        score -= cards_used * 8.0
+        # TeamCar scores only depend on the hand, so score them once
+        team_car_score = self._score_team_car(player)
+        weights = self.FEATURE_WEIGHTS
+
+        travel_features = {}  # See _move_features
+        scores = [team_car_score if move.action_type is ActionType.TEAM_CAR
+                  else sum(map(mul, self._move_features(move, engine, travel_features), weights))
+                  for move in valid_moves]
+
+        # Highest score wins (first one on ties)
+        return valid_moves[scores.index(max(scores))]
+
+    def _score_team_car(self, player: Player) -> float:
+        # Base score for TeamCar is low, unless we really need cards
+        score = -20.0
+        # Bonus for low hand size
+        if len(player.hand) <= 2:
+            score += 60.0
+        elif len(player.hand) <= 3:
+            score += 30.0
+        return score
 
-        # 5. Checkpoints (Card draw potential)
-        checkpoints = self._count_checkpoints(move, engine)
-        score += checkpoints * 15.0
+    def _move_features(self, move: Move, engine: GameEngine,
+                       travel_features: Optional[Dict[tuple, Tuple[int, int]]] = None) -> Tuple[int, int, int, int]:
+        """Features of a non-TeamCar move, matching FEATURE_WEIGHTS
 
-        return score
+        Points and checkpoints only depend on the riders moved and the distance;
+        travel_features, if given, keeps them per (rider, distance, drafters) so
+        moves that only differ in their cards share them.
+        """
+        distance = self._get_move_distance(move, engine)
+        if travel_features is None:
+            points, checkpoints = self._travel_features(move, distance, engine)
+        else:
+            key = (id(move.rider), distance, tuple(map(id, move.drafting_riders)))
+            features = travel_features.get(key)
+            if features is None:
+                features = travel_features[key] = self._travel_features(move, distance, engine)
+            points, checkpoints = features
+        return (
+            calculate_total_advancement(engine, move),  # Advancement
+            points,  # Points (Sprints/Finish)
+            len(move.cards),  # Card efficiency (penalize using cards)
+            checkpoints,  # Checkpoints (card draw potential)
+        )
 
     def _get_move_distance(self, move: Move, engine: GameEngine) -> int:
         """Calculate distance for any move type"""
-        if move.action_type in [ActionType.PULL, ActionType.TEAM_PULL]:
-            return engine._calculate_pull_movement(move.rider, move.cards)
-        elif move.action_type == ActionType.ATTACK:
-            return engine._calculate_attack_movement(move.rider, move.cards)
-        elif move.action_type in [ActionType.DRAFT, ActionType.TEAM_DRAFT]:
-            if engine.state.last_move:
-                return engine.state.last_move.get('movement', 0)
-        return 0
-
-    def _estimate_points(self, move: Move, engine: GameEngine) -> int:
-        """Estimate points earned by this move"""
-        points = 0
-        riders = [move.rider]
-        if move.drafting_riders:
-            riders.extend(move.drafting_riders)
+        return calculate_move_distance(engine, move)
 
-        distance = self._get_move_distance(move, engine)
+    def _travel_features(self, move: Move, distance: int, engine: GameEngine) -> Tuple[int, int]:
+        """Points earned and new checkpoints (card draws) reached by the riders moved"""
         if distance == 0:
-            return 0
+            return 0, 0
 
-        for rider in riders:
-            old_pos = rider.position
-            new_pos = min(old_pos + distance, engine.state.track_length - 1)
-
-            # Check all tiles crossed
-            for pos in range(old_pos + 1, new_pos + 1):
-                tile = engine.state.get_tile_at_position(pos)
-                if tile and tile.terrain in [TerrainType.SPRINT, TerrainType.FINISH]:
-                    # Check if points are still available
-                    arrivals = engine.state.sprint_arrivals.get(pos, [])
-                    if rider in arrivals:
-                        continue
-                    current_rank = len(arrivals)
-                    if tile.sprint_points and current_rank < len(tile.sprint_points):
-                        points += tile.sprint_points[current_rank]
-        return points
-
-    def _count_checkpoints(self, move: Move, engine: GameEngine) -> int:
-        """Count new checkpoints reached"""
-        count = 0
-        riders = [move.rider]
-        if move.drafting_riders:
-            riders.extend(move.drafting_riders)
-
-        distance = self._get_move_distance(move, engine)
-        if distance == 0:
-            return 0
+        riders = (move.rider, *move.drafting_riders)
 
+        points = 0
+        checkpoints = 0
+        state = engine.state
+        track_end = state.track_length - 1
         for rider in riders:
             old_pos = rider.position
-            new_pos = min(old_pos + distance, engine.state.track_length - 1)
-
+            new_pos = min(old_pos + distance, track_end)
+            points += sprint_points_won(state, rider, old_pos, new_pos)
             # Checkpoints are at 10, 20, 30...
-            for cp in range(10, new_pos + 1, 10):
-                if cp > old_pos and not engine.state.has_rider_reached_checkpoint(rider, cp):
-                    count += 1
-        return count
+            checkpoints += len(state.new_checkpoints(rider, old_pos, new_pos))
+        return points, checkpoints
 
 
 class TobiBotAgent(Agent):
@@ -829,6 +926,8 @@ class TobiBotAgent(Agent):
     7. TeamCar if any isolated rider lacks good options
     """
 
+    __slots__ = ()
+
     def __init__(self, player_id: int):
         super().__init__(player_id, "TobiBot")
 
@@ -836,158 +935,111 @@ class TobiBotAgent(Agent):
         valid_moves = engine.get_valid_moves(player, eligible_riders)
         if not valid_moves:
             return None
+        if len(valid_moves) == 1:
+            return valid_moves[0]
+
+        ctx = TurnContext(engine, player, valid_moves, eligible_riders)
 
         # Priority 1: Score points when possible
-        scoring_moves = self._get_scoring_moves(valid_moves, engine)
+        scoring_moves, points = scoring_moves_by_points(valid_moves, engine, self._calculate_points)
         if scoring_moves:
             # Return move that scores most points
-            return max(scoring_moves, key=lambda m: self._calculate_points(m, engine))
+            return max(scoring_moves, key=lambda m: points[id(m)])
 
         # Priority 2: Hand management - TeamCar if hand ≤ 6 and no efficient moves
         if len(player.hand) <= 6:
-            # Check if any move has >=1 field per card
-            has_efficient_move = False
-            for move in valid_moves:
-                if move.action_type == ActionType.TEAM_CAR:
-                    continue
-                advancement = calculate_total_advancement(engine, move)
-                # Skip moves with 0 advancement
-                if advancement == 0:
-                    continue
-                cards_used = len(move.cards)
-                if cards_used == 0:
-                    # Free move with advancement > 0 is efficient
-                    has_efficient_move = True
-                    break
-                if advancement / cards_used >= 1:
-                    has_efficient_move = True
-                    break
-
-            if not has_efficient_move:
-                team_car_moves = [m for m in valid_moves if m.action_type == ActionType.TEAM_CAR]
-                if team_car_moves:
-                    return team_car_moves[0]
+            # Only take the TeamCar if no move gets >=1 field per card
+            if not has_efficient_move(valid_moves):
+                team_car_move = ctx.team_car_move()
+                if team_car_move:
+                    return team_car_move
 
         # Priority 3: Prefer efficient moves (filter out 0-advancement moves)
         # TeamDraft
-        team_draft_moves = [m for m in valid_moves
-                           if m.action_type == ActionType.TEAM_DRAFT
-                           and calculate_total_advancement(engine, m) > 0]
+        team_draft_moves = ctx.productive(ActionType.TEAM_DRAFT)
         if team_draft_moves:
-            return max(team_draft_moves, key=lambda m: calculate_total_advancement(engine, m))
+            return max(team_draft_moves, key=attrgetter('advancement'))
 
         # Draft
-        draft_moves = [m for m in valid_moves
-                      if m.action_type == ActionType.DRAFT
-                      and calculate_total_advancement(engine, m) > 0]
+        draft_moves = ctx.productive(ActionType.DRAFT)
         if draft_moves:
-            return max(draft_moves, key=lambda m: calculate_total_advancement(engine, m))
+            return max(draft_moves, key=attrgetter('advancement'))
 
         # TeamPull
-        team_pull_moves = [m for m in valid_moves
-                          if m.action_type == ActionType.TEAM_PULL
-                          and calculate_total_advancement(engine, m) > 0]
+        team_pull_moves = ctx.productive(ActionType.TEAM_PULL)
         if team_pull_moves:
             # Apply priority 4-6 to select best TeamPull
-            return self._select_best_move(team_pull_moves, engine, player)
+            return self._select_best_move(team_pull_moves, ctx)
 
         # Apply priorities 4-6 to remaining moves (excluding TeamCar and 0-advancement moves)
-        non_team_car = [m for m in valid_moves
-                       if m.action_type != ActionType.TEAM_CAR
-                       and calculate_total_advancement(engine, m) > 0]
-        if non_team_car:
-            return self._select_best_move(non_team_car, engine, player)
+        if ctx.productive_moves:
+            return self._select_best_move(ctx.productive_moves, ctx)
 
         # Priority 7: If any isolated rider lacks good options, consider TeamCar
         eligible_riders_list = eligible_riders if eligible_riders is not None else player.riders
         if eligible_riders_list:
             # Check if any eligible rider is isolated
+            riders_by_position = ctx.riders_by_position
             for rider in eligible_riders_list:
-                if self._is_rider_isolated(rider, engine, player):
+                if self._is_rider_isolated(rider, engine, player, riders_by_position):
                     # Check if this rider can draft or advance >4 fields
-                    rider_moves = [m for m in valid_moves if m.rider == rider]
-                    can_draft = any(m.action_type in [ActionType.DRAFT, ActionType.TEAM_DRAFT] for m in rider_moves)
+                    rider_moves = engine.rider_moves(player, rider, eligible_riders)
+                    can_draft = any(m.action_type.bit & DRAFT_ACTIONS for m in rider_moves)
                     can_advance_far = any(calculate_move_distance(engine, m) > 4 for m in rider_moves
-                                         if m.action_type in [ActionType.PULL, ActionType.ATTACK])
+                                         if m.action_type.bit & (ActionType.PULL.bit | ActionType.ATTACK.bit))
 
                     if not can_draft and not can_advance_far:
-                        team_car_moves = [m for m in valid_moves if m.action_type == ActionType.TEAM_CAR]
-                        if team_car_moves:
-                            return team_car_moves[0]
+                        team_car_move = ctx.team_car_move()
+                        if team_car_move:
+                            return team_car_move
 
         # Fallback
         return valid_moves[0]
 
-    def _get_scoring_moves(self, valid_moves: List[Move], engine: GameEngine) -> List[Move]:
-        """Get moves that can score points at sprint or finish"""
-        scoring_moves = []
-        for move in valid_moves:
-            if move.action_type == ActionType.TEAM_CAR:
-                continue
-            if self._calculate_points(move, engine) > 0:
-                scoring_moves.append(move)
-        return scoring_moves
-
     def _calculate_points(self, move: Move, engine: GameEngine) -> int:
         """Calculate total points this move would score"""
         points = 0
-        riders = [move.rider]
-        if move.drafting_riders:
-            riders.extend(move.drafting_riders)
+        riders = (move.rider, *move.drafting_riders)
 
+        state = engine.state
+        track_end = state.track_length - 1
         for rider in riders:
             distance = self._get_rider_movement(move, rider, engine)
             if distance == 0:
                 continue
 
             old_pos = rider.position
-            new_pos = min(old_pos + distance, engine.state.track_length - 1)
-
-            for pos in range(old_pos + 1, new_pos + 1):
-                tile = engine.state.get_tile_at_position(pos)
-                if tile and tile.terrain in [TerrainType.SPRINT, TerrainType.FINISH]:
-                    arrivals = engine.state.sprint_arrivals.get(pos, [])
-                    if rider in arrivals:
-                        continue
-                    current_rank = len(arrivals)
-                    if tile.sprint_points and current_rank < len(tile.sprint_points):
-                        points += tile.sprint_points[current_rank]
+            points += sprint_points_won(state, rider, old_pos, min(old_pos + distance, track_end))
         return points
 
     def _get_rider_movement(self, move: Move, rider: Rider, engine: GameEngine) -> int:
         """Get movement for a specific rider in a move"""
-        if rider == move.rider:
-            # Primary rider
-            if move.action_type == ActionType.PULL:
-                base = engine._calculate_pull_movement(move.rider, move.cards)
-            elif move.action_type == ActionType.ATTACK:
-                base = engine._calculate_attack_movement(move.rider, move.cards)
-            elif move.action_type in [ActionType.DRAFT, ActionType.TEAM_DRAFT]:
-                base = engine.state.last_move.get('movement', 0) if engine.state.last_move else 0
-            elif move.action_type == ActionType.TEAM_PULL:
-                base = engine._calculate_pull_movement(move.rider, move.cards)
-            else:
-                return 0
-            return engine._calculate_limited_movement(rider, rider.position, base)
-        else:
-            # Drafting rider
-            if move.action_type == ActionType.TEAM_PULL:
-                base = engine._calculate_pull_movement(move.rider, move.cards)
-            elif move.action_type == ActionType.TEAM_DRAFT:
-                base = engine.state.last_move.get('movement', 0) if engine.state.last_move else 0
-            else:
-                return 0
-            return engine._calculate_limited_movement(rider, rider.position, base)
+        if not move.action_type.bit & TEAM_ACTIONS and rider != move.rider:
+            return 0  # Only team moves carry drafting riders
+        base = calculate_move_distance(engine, move)
+        return engine._calculate_limited_movement(rider, rider.position, base)
 
-    def _is_rider_isolated(self, rider: Rider, engine: GameEngine, player: Player) -> bool:
-        """Check if rider is on a field with no teammates"""
-        riders_at_pos = engine.state.get_riders_at_position(rider.position)
-        teammates = [r for r in riders_at_pos if r.player_id == player.player_id and r != rider]
-        return len(teammates) == 0
+    def _is_rider_isolated(self, rider: Rider, engine: GameEngine, player: Player,
+                           riders_by_position: Optional[Dict[int, List[Rider]]] = None) -> bool:
+        """Check if rider is on a field with no teammates
 
-    def _select_best_move(self, moves: List[Move], engine: GameEngine, player: Player) -> Move:
+        riders_by_position (from state.get_riders_by_position) saves a scan of all
+        riders when several riders are checked in one turn.
+        """
+        if riders_by_position is not None:
+            riders_at_pos = riders_by_position.get(rider.position, [])
+        else:
+            riders_at_pos = engine.state.get_riders_at_position(rider.position)
+        return not any(r.player_id == player.player_id and r != rider for r in riders_at_pos)
+
+    def _select_best_move(self, moves: List[Move], ctx: TurnContext) -> Move:
         """Select best move considering priorities 4-6"""
-        scored_moves = []
+        scored_moves = []  # Moves that advance, with their scores in `scores`
+        scores = []
+        engine = ctx.engine
+        own_by_pos, opp_by_pos = ctx.riders_by_side
+        track_end = engine.state.track_length - 1
+        is_el_patron = (engine.state.el_patron == ctx.player.player_id)
 
         for move in moves:
             score = 0.0
@@ -996,20 +1048,17 @@ class TobiBotAgent(Agent):
             distance = calculate_move_distance(engine, move)
             if distance == 0:
                 continue
-            destination = min(move.rider.position + distance, engine.state.track_length - 1)
+            destination = min(move.rider.position + distance, track_end)
 
             # Priority 4: Advance to field with team riders (only if moving forward to join them)
-            riders_at_dest = engine.state.get_riders_at_position(destination)
-            teammates_at_dest = [r for r in riders_at_dest if r.player_id == player.player_id and r != move.rider]
+            teammates_at_dest = [r for r in own_by_pos.get(destination, ()) if r is not move.rider]
             # Only give bonus if destination is ahead of current position
             if destination > move.rider.position:
                 score += len(teammates_at_dest) * 50
 
             # Priority 5: When El Patron, move to fields with opponents
-            is_el_patron = (engine.state.el_patron == player.player_id)
             if is_el_patron:
-                opponents_at_dest = [r for r in riders_at_dest if r.player_id != player.player_id]
-                score += len(opponents_at_dest) * 40
+                score += len(opp_by_pos.get(destination, ())) * 40
 
             # Priority 6: Maximize team advancement while respecting terrain limits
             total_advancement = calculate_total_advancement(engine, move)
@@ -1022,24 +1071,52 @@ class TobiBotAgent(Agent):
                 score += efficiency * 5  # Bonus for efficient card usage
 
             # For team moves, check if we're respecting terrain limits
-            if move.action_type in [ActionType.TEAM_PULL, ActionType.TEAM_DRAFT]:
-                # Calculate minimum movement among all riders
-                min_movement = distance
-                for rider in [move.rider] + list(move.drafting_riders):
-                    rider_movement = self._get_rider_movement(move, rider, engine)
-                    min_movement = min(min_movement, rider_movement)
+            if move.action_type.bit & TEAM_ACTIONS:
+                # Calculate minimum movement among all riders (none exceeds distance)
+                min_movement = min(engine._calculate_limited_movement(rider, rider.position, distance)
+                                   for rider in chain((move.rider,), move.drafting_riders))
 
                 # Bonus if we're keeping team together (all riders move similar distance)
                 if min_movement > 0:
                     score += min_movement * 5
 
-            scored_moves.append((score, move))
+            scored_moves.append(move)
+            scores.append(score)
 
         if scored_moves:
-            return max(scored_moves, key=lambda x: x[0])[1]
+            return scored_moves[scores.index(max(scores))]
         return moves[0]
 
 
+# Terrains where Sprinters get a terrain matching bonus, as TerrainType.bit mask
+SPRINTER_TERRAINS = TerrainType.FLAT.bit | TerrainType.DESCENT.bit
+
+
+def _simple_terrain_match_score(rider_type: CardType, terrain: TerrainType) -> float:
+    """ClaudeBot2's terrain matching bonus for a rider type on a terrain"""
+    score = 0.0
+
+    # Bonus for good matches
+    if rider_type == CardType.CLIMBER and terrain == TerrainType.CLIMB:
+        score += 30
+    elif rider_type == CardType.SPRINTER and terrain.bit & SPRINTER_TERRAINS:
+        score += 25
+    elif rider_type == CardType.ROULEUR:
+        score += 10
+
+    # Penalty for terrain-limited riders
+    if TERRAIN_LIMIT_TABLE[rider_type.index][terrain.index] is not None:
+        score -= 20
+
+    return score
+
+
+# _simple_terrain_match_score as a table indexed by [rider_type.index][terrain.index]
+SIMPLE_TERRAIN_MATCH_TABLE = [
+    [_simple_terrain_match_score(rider_type, terrain) for terrain in TerrainType] for rider_type in CardType
+]
+
+
 class ClaudeBot2Agent(Agent):
     """
     ClaudeBot 2.0: Redesigned based on comprehensive 250-game analysis.
@@ -1061,190 +1138,101 @@ class ClaudeBot2Agent(Agent):
     Strategy: Strict priority hierarchy with efficiency gating, not weighted scoring.
     """
 
+    __slots__ = ()
+
     def __init__(self, player_id: int):
         super().__init__(player_id, "ClaudeBot2.0")
-        from game_engine import TERRAIN_LIMITS
-        self.terrain_limits = TERRAIN_LIMITS
 
     def choose_move(self, engine: GameEngine, player: Player, eligible_riders: List[Rider] = None) -> Optional[Move]:
         """Choose move using TobiBot-inspired priority hierarchy"""
         valid_moves = engine.get_valid_moves(player, eligible_riders)
         if not valid_moves:
             return None
+        if len(valid_moves) == 1:
+            return valid_moves[0]
+
+        ctx = TurnContext(engine, player, valid_moves, eligible_riders)
 
         # PRIORITY 1: Score points when possible (finish > sprint)
-        scoring_moves = self._get_scoring_moves(valid_moves, engine)
+        # (the weighted points are positive exactly when the move scores points)
+        scoring_moves, points = scoring_moves_by_points(valid_moves, engine, self._calculate_points_with_priority)
         if scoring_moves:
             # Return move that scores most points, preferring finish over sprint
-            return max(scoring_moves, key=lambda m: self._calculate_points_with_priority(m, engine))
+            return max(scoring_moves, key=lambda m: points[id(m)])
 
         # PRIORITY 2: Hand management - TeamCar if hand ≤ 6 and no efficient moves
         if len(player.hand) <= 6:
-            # Check if any move has >=1 field per card efficiency
-            has_efficient_move = False
-            for move in valid_moves:
-                if move.action_type == ActionType.TEAM_CAR:
-                    continue
-                advancement = calculate_total_advancement(engine, move)
-                if advancement == 0:
-                    continue
-                cards_used = len(move.cards)
-                if cards_used == 0:
-                    has_efficient_move = True
-                    break
-                if advancement / cards_used >= 1.0:
-                    has_efficient_move = True
-                    break
-
-            if not has_efficient_move:
-                team_car_moves = [m for m in valid_moves if m.action_type == ActionType.TEAM_CAR]
-                if team_car_moves:
-                    return team_car_moves[0]
+            # Only take the TeamCar if no move gets >=1 field per card
+            if not has_efficient_move(valid_moves):
+                team_car_move = ctx.team_car_move()
+                if team_car_move:
+                    return team_car_move
 
         # PRIORITY 3: Prefer efficient free movement (TeamDraft > Draft > TeamPull)
-        # Filter out 0-advancement moves
-        productive_moves = [m for m in valid_moves
-                           if m.action_type != ActionType.TEAM_CAR
-                           and calculate_total_advancement(engine, m) > 0]
-
-        if not productive_moves:
-            # Fallback to TeamCar if nothing productive
-            team_car_moves = [m for m in valid_moves if m.action_type == ActionType.TEAM_CAR]
-            if team_car_moves:
-                return team_car_moves[0]
-            return valid_moves[0] if valid_moves else None
+        team_draft_moves = ctx.productive(ActionType.TEAM_DRAFT)
+        draft_moves = ctx.productive(ActionType.DRAFT)
+        team_pull_moves = ctx.productive(ActionType.TEAM_PULL)
 
         # TeamDraft: Multiple riders move for free
-        team_draft_moves = [m for m in productive_moves if m.action_type == ActionType.TEAM_DRAFT]
         if team_draft_moves:
-            return max(team_draft_moves, key=lambda m: calculate_total_advancement(engine, m))
+            return max(team_draft_moves, key=attrgetter('advancement'))
 
         # Draft: Single rider moves for free
-        draft_moves = [m for m in productive_moves if m.action_type == ActionType.DRAFT]
         if draft_moves:
-            return max(draft_moves, key=lambda m: calculate_total_advancement(engine, m))
+            return max(draft_moves, key=attrgetter('advancement'))
 
         # TeamPull: One rider pulls, others draft (efficient team coordination)
-        team_pull_moves = [m for m in productive_moves if m.action_type == ActionType.TEAM_PULL]
         if team_pull_moves:
-            return self._select_best_team_pull(team_pull_moves, engine, player)
+            return self._select_best_team_pull(team_pull_moves, ctx)
 
         # PRIORITY 4: Remaining moves (Pull, Attack) - select with terrain optimization
-        remaining_moves = [m for m in productive_moves
-                          if m.action_type in [ActionType.PULL, ActionType.ATTACK]]
-        if remaining_moves:
-            return self._select_best_advancement_move(remaining_moves, engine, player)
-
-        # Fallback: any productive move
-        if productive_moves:
-            return max(productive_moves, key=lambda m: calculate_total_advancement(engine, m))
+        # (with no free or team moves left, the productive moves are exactly these)
+        if ctx.productive_moves:
+            return self._select_best_advancement_move(ctx.productive_moves, ctx)
 
-        # Last resort: TeamCar
-        team_car_moves = [m for m in valid_moves if m.action_type == ActionType.TEAM_CAR]
-        if team_car_moves:
-            return team_car_moves[0]
+        # Nothing productive: fall back to TeamCar
+        team_car_move = ctx.team_car_move()
+        if team_car_move:
+            return team_car_move
 
-        return valid_moves[0] if valid_moves else None
-
-    def _get_scoring_moves(self, valid_moves: List[Move], engine: GameEngine) -> List[Move]:
-        """Get moves that can score points at sprint or finish"""
-        scoring_moves = []
-        for move in valid_moves:
-            if move.action_type == ActionType.TEAM_CAR:
-                continue
-            if self._calculate_points(move, engine) > 0:
-                scoring_moves.append(move)
-        return scoring_moves
-
-    def _calculate_points(self, move: Move, engine: GameEngine) -> int:
-        """Calculate total points this move would score"""
-        points = 0
-        riders = [move.rider]
-        if move.drafting_riders:
-            riders.extend(move.drafting_riders)
-
-        for rider in riders:
-            distance = self._get_rider_movement(move, rider, engine)
-            if distance == 0:
-                continue
-
-            old_pos = rider.position
-            new_pos = min(old_pos + distance, engine.state.track_length - 1)
-
-            for pos in range(old_pos + 1, new_pos + 1):
-                tile = engine.state.get_tile_at_position(pos)
-                if tile and tile.terrain in [TerrainType.SPRINT, TerrainType.FINISH]:
-                    arrivals = engine.state.sprint_arrivals.get(pos, [])
-                    if rider in arrivals:
-                        continue
-                    current_rank = len(arrivals)
-                    if tile.sprint_points and current_rank < len(tile.sprint_points):
-                        points += tile.sprint_points[current_rank]
-        return points
+        return valid_moves[0]
 
     def _calculate_points_with_priority(self, move: Move, engine: GameEngine) -> float:
         """Calculate points with finish line heavily prioritized over sprints"""
-        finish_points = 0
-        sprint_points = 0
+        points = 0.0
 
-        riders = [move.rider]
-        if move.drafting_riders:
-            riders.extend(move.drafting_riders)
+        riders = (move.rider, *move.drafting_riders)
 
+        state = engine.state
+        track_end = state.track_length - 1
+        base = calculate_move_distance(engine, move)
         for rider in riders:
+            # Terrain limits only shorten the move, so a rider with no sprint or
+            # finish within the base distance can't score
+            old_pos = rider.position
+            if not state.scoring_positions_crossed(old_pos, old_pos + base):
+                continue
             distance = self._get_rider_movement(move, rider, engine)
             if distance == 0:
                 continue
 
-            old_pos = rider.position
-            new_pos = min(old_pos + distance, engine.state.track_length - 1)
-
-            for pos in range(old_pos + 1, new_pos + 1):
-                tile = engine.state.get_tile_at_position(pos)
-                if tile and tile.terrain == TerrainType.FINISH:
-                    arrivals = engine.state.sprint_arrivals.get(pos, [])
-                    if rider not in arrivals:
-                        current_rank = len(arrivals)
-                        if tile.sprint_points and current_rank < len(tile.sprint_points):
-                            finish_points += tile.sprint_points[current_rank]
-                elif tile and tile.terrain == TerrainType.SPRINT:
-                    arrivals = engine.state.sprint_arrivals.get(pos, [])
-                    if rider not in arrivals:
-                        current_rank = len(arrivals)
-                        if tile.sprint_points and current_rank < len(tile.sprint_points):
-                            sprint_points += tile.sprint_points[current_rank]
-
-        # Finish points are 55% of winner's score, weight them 3x higher
-        return finish_points * 3.0 + sprint_points
+            # Finish points are 55% of winner's score, weight them 3x higher
+            points += sprint_points_won(state, rider, old_pos, min(old_pos + distance, track_end), finish_weight=3.0)
+        return points
 
     def _get_rider_movement(self, move: Move, rider: Rider, engine: GameEngine) -> int:
         """Get movement for a specific rider in a move"""
-        if rider == move.rider:
-            # Primary rider
-            if move.action_type == ActionType.PULL:
-                base = engine._calculate_pull_movement(move.rider, move.cards)
-            elif move.action_type == ActionType.ATTACK:
-                base = engine._calculate_attack_movement(move.rider, move.cards)
-            elif move.action_type in [ActionType.DRAFT, ActionType.TEAM_DRAFT]:
-                base = engine.state.last_move.get('movement', 0) if engine.state.last_move else 0
-            elif move.action_type == ActionType.TEAM_PULL:
-                base = engine._calculate_pull_movement(move.rider, move.cards)
-            else:
-                return 0
-            return engine._calculate_limited_movement(rider, rider.position, base)
-        else:
-            # Drafting rider
-            if move.action_type == ActionType.TEAM_PULL:
-                base = engine._calculate_pull_movement(move.rider, move.cards)
-            elif move.action_type == ActionType.TEAM_DRAFT:
-                base = engine.state.last_move.get('movement', 0) if engine.state.last_move else 0
-            else:
-                return 0
-            return engine._calculate_limited_movement(rider, rider.position, base)
+        if not move.action_type.bit & TEAM_ACTIONS and rider != move.rider:
+            return 0  # Only team moves carry drafting riders
+        base = calculate_move_distance(engine, move)
+        return engine._calculate_limited_movement(rider, rider.position, base)
 
-    def _select_best_team_pull(self, moves: List[Move], engine: GameEngine, player: Player) -> Move:
+    def _select_best_team_pull(self, moves: List[Move], ctx: TurnContext) -> Move:
         """Select best TeamPull considering efficiency and positioning"""
-        scored_moves = []
+        scores = []
+        engine = ctx.engine
+        own_by_pos = ctx.riders_by_side[0]
+        track_end = engine.state.track_length - 1
 
         for move in moves:
             score = 0.0
@@ -1260,28 +1248,34 @@ class ClaudeBot2Agent(Agent):
                 score += efficiency * 20  # Reward high efficiency
 
             # Bonus for grouping riders together (team coordination)
-            destination = min(move.rider.position + self._get_rider_movement(move, move.rider, engine),
-                            engine.state.track_length - 1)
-            riders_at_dest = engine.state.get_riders_at_position(destination)
-            own_riders = [r for r in riders_at_dest if r.player_id == player.player_id and r != move.rider]
+            rider = move.rider
+            base = calculate_move_distance(engine, move)
+            movement = engine._calculate_limited_movement(rider, rider.position, base)
+            destination = min(rider.position + movement, track_end)
+            own_riders = [r for r in own_by_pos.get(destination, ()) if r is not rider]
             score += len(own_riders) * 15
 
             # Terrain matching bonus
             score += self._score_terrain_matching_simple(move, engine)
 
-            scored_moves.append((score, move))
+            scores.append(score)
 
-        return max(scored_moves, key=lambda x: x[0])[1]
+        return moves[scores.index(max(scores))]
 
-    def _select_best_advancement_move(self, moves: List[Move], engine: GameEngine, player: Player) -> Move:
+    def _select_best_advancement_move(self, moves: List[Move], ctx: TurnContext) -> Move:
         """Select best Pull/Attack move with terrain optimization"""
-        scored_moves = []
+        scores = []
+        engine = ctx.engine
+        opp_by_pos = ctx.riders_by_side[1]
+        track_end = engine.state.track_length - 1
 
         for move in moves:
             score = 0.0
 
             # Base score: actual movement after terrain limits
-            distance = self._get_rider_movement(move, move.rider, engine)
+            rider = move.rider
+            base = calculate_move_distance(engine, move)
+            distance = engine._calculate_limited_movement(rider, rider.position, base)
             score += distance * 10
 
             # Card efficiency penalty
@@ -1296,35 +1290,35 @@ class ClaudeBot2Agent(Agent):
             score += self._score_terrain_matching_simple(move, engine)
 
             # Positioning for future drafts
-            destination = min(move.rider.position + distance, engine.state.track_length - 1)
-            riders_at_dest = engine.state.get_riders_at_position(destination)
-            opponent_riders = [r for r in riders_at_dest if r.player_id != player.player_id]
-            score += len(opponent_riders) * 20  # Good for future drafting
+            destination = min(rider.position + distance, track_end)
+            score += len(opp_by_pos.get(destination, ())) * 20  # Good for future drafting
 
-            scored_moves.append((score, move))
+            scores.append(score)
 
-        return max(scored_moves, key=lambda x: x[0])[1]
+        return moves[scores.index(max(scores))]
 
     def _score_terrain_matching_simple(self, move: Move, engine: GameEngine) -> float:
-        """Simple terrain matching bonus"""
-        score = 0.0
-        rider_type = move.rider.rider_type
-        current_terrain = engine._get_terrain_at_position(move.rider.position)
+        """Simple terrain matching bonus (see _simple_terrain_match_score)"""
+        rider = move.rider
+        terrain = engine.state.movement_terrain[rider.position]
+        return SIMPLE_TERRAIN_MATCH_TABLE[rider.rider_type.index][terrain.index]
 
-        # Bonus for good matches
-        if rider_type == CardType.CLIMBER and current_terrain == TerrainType.CLIMB:
-            score += 30
-        elif rider_type == CardType.SPRINTER and current_terrain in [TerrainType.FLAT, TerrainType.DESCENT]:
-            score += 25
-        elif rider_type == CardType.ROULEUR:
-            score += 10
 
-        # Penalty for terrain-limited riders
-        if (rider_type, current_terrain) in self.terrain_limits:
-            score -= 20
+def _chatgpt_terrain_bonus(rider_type: CardType, terrain: TerrainType) -> float:
+    """ChatGPT's terrain matching bonus for a rider type on a terrain"""
+    if rider_type == CardType.CLIMBER and terrain == TerrainType.CLIMB:
+        return 10.0
+    elif rider_type == CardType.SPRINTER and terrain.bit & SPRINTER_TERRAINS:
+        return 8.0
+    elif rider_type == CardType.ROULEUR:
+        return 4.0
+    return 0.0
 
-        return score
 
+# _chatgpt_terrain_bonus as a table indexed by [rider_type.index][terrain.index]
+CHATGPT_TERRAIN_BONUS_TABLE = [
+    [_chatgpt_terrain_bonus(rider_type, terrain) for terrain in TerrainType] for rider_type in CardType
+]
 
 
 class ChatGPTAgent(Agent):
@@ -1333,6 +1327,8 @@ class ChatGPTAgent(Agent):
     and card efficiency while preferring free movement when possible.
     """
 
+    __slots__ = ()
+
     def __init__(self, player_id: int):
         super().__init__(player_id, "ChatGPT")
 
@@ -1340,31 +1336,44 @@ class ChatGPTAgent(Agent):
         valid_moves = engine.get_valid_moves(player, eligible_riders)
         if not valid_moves:
             return None
+        if len(valid_moves) == 1:
+            return valid_moves[0]
 
         # Low hand: prioritize free movement, then refill
-        if len(player.hand) < 3:
-            draft_move = get_best_draft_move(valid_moves)
-            if draft_move:
-                return draft_move
-            if should_use_team_car(player, valid_moves):
-                team_car_moves = [m for m in valid_moves if m.action_type == ActionType.TEAM_CAR]
-                if team_car_moves:
-                    return team_car_moves[0]
+        low_hand_move = get_low_hand_move(engine, player, valid_moves, eligible_riders)
+        if low_hand_move:
+            return low_hand_move
 
         # Filter out moves that cost cards but have 0 advancement
         valid_moves = filter_wasteful_moves(valid_moves, engine)
 
-        scored_moves = []
+        # A move's score only depends on its rider, action, distance, number of
+        # cards and drafters, so moves that only differ in which cards of a type
+        # they play are scored once
+        travel_scores = {}  # See _score_move
+        move_scores = {}
+        scores = []
         for move in valid_moves:
-            score = self._score_move(move, engine, player)
-            scored_moves.append((score, move))
-
-        scored_moves.sort(key=lambda x: x[0], reverse=True)
-        return scored_moves[0][1]
-
-    def _score_move(self, move: Move, engine: GameEngine, player: Player) -> float:
+            key = (id(move.rider), move.action_type, calculate_move_distance(engine, move), len(move.cards),
+                   tuple(map(id, move.drafting_riders)))
+            score = move_scores.get(key)
+            if score is None:
+                score = move_scores[key] = self._score_move(move, engine, player, travel_scores)
+            scores.append(score)
+
+        # Highest score wins (first one on ties)
+        return valid_moves[scores.index(max(scores))]
+
+    def _score_move(self, move: Move, engine: GameEngine, player: Player,
+                    travel_scores: Optional[Dict[tuple, Tuple[int, float]]] = None) -> float:
+        """Score a move
+
+        Advancement and sprint points only depend on the riders moved and the
+        base movement; travel_scores, if given, keeps them per (rider, base
+        movement, drafters) so moves that only differ in their cards share them.
+        """
         # TeamCar is a fallback unless hand is low
-        if move.action_type == ActionType.TEAM_CAR:
+        if move.action_type is ActionType.TEAM_CAR:
             if len(player.hand) <= 1:
                 return 40.0
             if len(player.hand) <= 2:
@@ -1375,96 +1384,350 @@ class ChatGPTAgent(Agent):
         if base_movement == 0:
             return -10.0
 
+        if travel_scores is None:
+            advancement, sprint_points = self._travel_scores(move, engine, base_movement)
+        else:
+            key = (id(move.rider), base_movement, tuple(map(id, move.drafting_riders)))
+            travel = travel_scores.get(key)
+            if travel is None:
+                travel = travel_scores[key] = self._travel_scores(move, engine, base_movement)
+            advancement, sprint_points = travel
+
         # Advancement: total team movement with terrain limits
-        advancement = self._calculate_total_movement(move, engine, base_movement)
         score = advancement * 8.0
 
         # Sprint/finish potential
-        score += self._score_sprints(move, engine, base_movement) * 30.0
+        score += sprint_points * 30.0
 
         # Card efficiency
         score -= len(move.cards) * 6.0
 
         # Prefer free movement
-        if move.action_type in [ActionType.DRAFT, ActionType.TEAM_DRAFT]:
+        if move.action_type.bit & DRAFT_ACTIONS:
             score += 15.0
 
         # Small bonus for drafting multiple riders
-        if move.action_type in [ActionType.TEAM_PULL, ActionType.TEAM_DRAFT]:
+        if move.action_type.bit & TEAM_ACTIONS:
             score += len(move.drafting_riders) * 5.0
 
         # Terrain matching bonus
-        current_terrain = engine._get_terrain_at_position(move.rider.position)
-        if move.rider.rider_type == CardType.CLIMBER and current_terrain == TerrainType.CLIMB:
-            score += 10.0
-        elif move.rider.rider_type == CardType.SPRINTER and current_terrain in [TerrainType.FLAT, TerrainType.DESCENT]:
-            score += 8.0
-        elif move.rider.rider_type == CardType.ROULEUR:
-            score += 4.0
+        rider = move.rider
+        current_terrain = engine.state.movement_terrain[rider.position]
+        score += CHATGPT_TERRAIN_BONUS_TABLE[rider.rider_type.index][current_terrain.index]
 
         return score
 
     def _get_base_movement(self, move: Move, engine: GameEngine) -> int:
-        if move.action_type in [ActionType.PULL, ActionType.TEAM_PULL]:
-            return engine._calculate_pull_movement(move.rider, move.cards)
-        if move.action_type == ActionType.ATTACK:
-            return engine._calculate_attack_movement(move.rider, move.cards)
-        if move.action_type in [ActionType.DRAFT, ActionType.TEAM_DRAFT]:
-            if engine.state.last_move:
-                return engine.state.last_move.get('movement', 0)
-        return 0
-
-    def _calculate_total_movement(self, move: Move, engine: GameEngine, base_movement: int) -> int:
-        total = engine._calculate_limited_movement(move.rider, move.rider.position, base_movement)
-        for drafter in move.drafting_riders:
-            total += engine._calculate_limited_movement(drafter, drafter.position, base_movement)
-        return total
-
-    def _score_sprints(self, move: Move, engine: GameEngine, base_movement: int) -> float:
-        score = 0.0
-        riders = [move.rider] + list(move.drafting_riders)
-        for rider in riders:
-            actual = engine._calculate_limited_movement(rider, rider.position, base_movement)
+        return calculate_move_distance(engine, move)
+
+    def _travel_scores(self, move: Move, engine: GameEngine, base_movement: int) -> Tuple[int, float]:
+        """Total team movement with terrain limits, and sprint/finish points won"""
+        state = engine.state
+        track_end = state.track_length - 1
+        # Points are only possible with a sprint or finish within reach
+        can_score = may_cross_scoring_position(state, move, base_movement)
+        advancement = 0
+        sprint_points = 0.0
+        for rider in (move.rider, *move.drafting_riders):
             old_pos = rider.position
-            new_pos = min(old_pos + actual, engine.state.track_length - 1)
-
-            for pos in range(old_pos + 1, new_pos + 1):
-                tile = engine.state.get_tile_at_position(pos)
-                if tile and tile.terrain in [TerrainType.SPRINT, TerrainType.FINISH]:
-                    arrivals = engine.state.sprint_arrivals.get(pos, [])
-                    if rider in arrivals:
-                        continue
-                    if tile.sprint_points and len(arrivals) < len(tile.sprint_points):
-                        score += tile.sprint_points[len(arrivals)]
-        return score
+            actual = engine._calculate_limited_movement(rider, old_pos, base_movement)
+            advancement += actual
+            if can_score:
+                sprint_points += sprint_points_won(state, rider, old_pos, min(old_pos + actual, track_end))
+        return advancement, sprint_points
+
+
+class AlphaBetaAgent(Agent):
+    """
+    AlphaBeta: Looks a few turns ahead with a depth-limited alpha-beta search.
+
+    The search plays moves out on a copy of the game state until the end of the
+    current round, undoing each one before trying the next. Our own turns maximize
+    the evaluation and every opponent turn is assumed to minimize it (paranoid
+    search). Moves are ordered by advancement net of cards spent and only the best
+    `beam_width` (plus the best free action of each kind) are expanded at each turn
+    to keep it fast.
+
+    Leaf evaluation compares our points, rider progress and hand size against the
+    strongest opponent. In the search copy the opponents' hands are dealt again at
+    random from the cards we can't see (their hands and the deck), so the agent
+    doesn't peek at their hands or at upcoming draws. The global random state is
+    restored afterwards.
+
+    Results are kept in a transposition table for the current search, so positions
+    reached again by a different move order aren't searched twice.
+    """
+
+    # Weights for the leaf evaluation
+    POINT_WEIGHT = 3.0
+    POSITION_WEIGHT = 1.0
+    HAND_WEIGHT = 1.0
+
+    # Max entries kept in the transposition table (least recently used are dropped)
+    TRANSPOSITION_TABLE_SIZE = 200_000
+
+    # Transposition table bound types
+    EXACT, LOWER_BOUND, UPPER_BOUND = range(3)
+
+    # A card's values, for transposition keys (cheaper than dataclasses.astuple)
+    _card_values = attrgetter(*(f.name for f in fields(Card)))
+
+    __slots__ = ('depth', 'beam_width', '_transpositions')
+
+    def __init__(self, player_id: int, depth: int = 2, beam_width: int = 6):
+        super().__init__(player_id, "AlphaBeta")
+        self.depth = depth
+        self.beam_width = beam_width
+        # Search results of the current turn:
+        # (state, move, depth) key -> (value, bound type)
+        self._transpositions: OrderedDict = OrderedDict()
+
+    def choose_move(self, engine: GameEngine, player: Player, eligible_riders: List[Rider] = None) -> Optional[Move]:
+        valid_moves = engine.get_valid_moves(player, eligible_riders)
+        if not valid_moves:
+            return None
+        if len(valid_moves) == 1:
+            return valid_moves[0]
+
+        moves = self._ordered_moves(valid_moves, engine)
+        if len(moves) == 1:
+            return moves[0]
+
+        acted_position = moves[0].rider.position if eligible_riders is None else eligible_riders[0].position
+        # Values depend on this turn's shuffled deck, so they can't be reused later
+        self._transpositions.clear()
+        saved_random_state = random.getstate()
+        try:
+            # Search from a copy where only our own hand is known
+            root_state, root_moves = copy.deepcopy((engine.state, moves), self._shared_memo(engine.state))
+            self._deal_unseen_cards(root_state)
+            # One engine for the whole search, so its caches carry over between nodes
+            root_engine = GameEngine(root_state)
+
+            best_move = moves[0]
+            alpha = float('-inf')
+            for move, root_move in zip(moves, root_moves):
+                value = self._alphabeta(root_engine, root_move, acted_position, self.depth - 1,
+                                        alpha, float('inf'))
+                if value > alpha:
+                    alpha = value
+                    best_move = move
+        finally:
+            random.setstate(saved_random_state)
+
+        return best_move
+
+    def _deal_unseen_cards(self, state: GameState):
+        """Shuffle the opponents' hands with the deck and deal them new hands of the same size"""
+        opponents = [p for p in state.players if p.player_id != self.player_id]
+        unseen = state.deck + [card for p in opponents for card in p.hand]
+        random.shuffle(unseen)
+        for opponent in opponents:
+            hand_size = len(opponent.hand)
+            opponent.hand[:] = unseen[:hand_size]
+            del unseen[:hand_size]
+        state.deck = unseen
+
+    def _ordered_moves(self, valid_moves: List[Move], engine: GameEngine) -> List[Move]:
+        """Drop wasteful moves, order the rest best-first and keep the top beam_width"""
+        # Unlike filter_wasteful_moves, keep free moves next to productive ones
+        moves = [m for m in valid_moves if not m.cards or calculate_total_advancement(engine, m) > 0]
+        if not moves:
+            moves = valid_moves
+        moves = sorted(moves, key=lambda m: calculate_total_advancement(engine, m) - len(m.cards),
+                       reverse=True)
+        beam = moves[:self.beam_width]
+        # Free actions are always worth a look, so keep the best of each
+        for action_type in (ActionType.DRAFT, ActionType.TEAM_DRAFT, ActionType.TEAM_CAR):
+            if not any(m.action_type is action_type for m in beam):
+                best_free = next((m for m in moves if m.action_type is action_type), None)
+                if best_free:
+                    beam.append(best_free)
+        return beam
+
+    def _alphabeta(self, engine: GameEngine, move: Move, acted_position: int, depth: int,
+                   alpha: float, beta: float) -> float:
+        """Value of playing `move` in the engine's state (for this agent), searching `depth` more turns"""
+        key = self._transposition_key(engine.state, move, acted_position, depth)
+        entry = self._transpositions.get(key)
+        if entry is not None:
+            self._transpositions.move_to_end(key)
+            value, bound = entry
+            if (bound == self.EXACT
+                    or (bound == self.LOWER_BOUND and value >= beta)
+                    or (bound == self.UPPER_BOUND and value <= alpha)):
+                return value
+
+        value = self._search(engine, move, acted_position, depth, alpha, beta)
+
+        # A cutoff only proves a bound on the true value
+        if value <= alpha:
+            bound = self.UPPER_BOUND
+        elif value >= beta:
+            bound = self.LOWER_BOUND
+        else:
+            bound = self.EXACT
+        self._transpositions[key] = (value, bound)
+        self._transpositions.move_to_end(key)
+        if len(self._transpositions) > self.TRANSPOSITION_TABLE_SIZE:
+            self._transpositions.popitem(last=False)
+        return value
+
+    def _search(self, engine: GameEngine, move: Move, acted_position: int, depth: int,
+                alpha: float, beta: float) -> float:
+        """Play `move` on the engine's state, search the turns that follow, then undo it"""
+        state = engine.state
+        saved = self._save_state(state)
+        try:
+            engine.execute_move(move)
+            state.mark_riders_moved([move.rider] + move.drafting_riders, acted_position)
+
+            if depth <= 0 or state.check_game_over():
+                return self._evaluate(state)
+            turn_info = state.determine_next_turn()
+            if turn_info is None:
+                return self._evaluate(state)  # Round is over
+
+            player, eligible_riders = turn_info
+            valid_moves = engine.get_valid_moves(player, eligible_riders)
+            if not valid_moves:
+                return self._evaluate(state)
+
+            next_position = eligible_riders[0].position
+            maximizing = player.player_id == self.player_id
+            value = float('-inf') if maximizing else float('inf')
+            for child in self._ordered_moves(valid_moves, engine):
+                child_value = self._alphabeta(engine, child, next_position, depth - 1, alpha, beta)
+                if maximizing:
+                    value = max(value, child_value)
+                    alpha = max(alpha, value)
+                else:
+                    value = min(value, child_value)
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    break  # The other side will never allow this line
+            return value
+        finally:
+            self._restore_state(state, saved)
+
+    @staticmethod
+    def _save_state(state: GameState) -> tuple:
+        """Copy the parts of the state a move can change within a round"""
+        return (
+            [r.position for p in state.players for r in p.riders],
+            [p.hand[:] for p in state.players],
+            [p.points for p in state.players],
+            state.deck[:],
+            state.discard_pile[:],
+            set(state.riders_moved_this_round),
+            {pos: set(ids) for pos, ids in state.players_acted_at_position.items()},
+            {pos: riders[:] for pos, riders in state.sprint_arrivals.items()},
+            dict(state.sprint_arrival_bits),
+            {rider: set(cps) for rider, cps in state.checkpoints_reached.items()},
+            state.last_move,
+            state.current_player_idx,
+            state.game_over,
+        )
+
+    @staticmethod
+    def _restore_state(state: GameState, saved: tuple):
+        """Undo everything since `saved` was taken, keeping the same Card and last-move objects
+        so the engine's valid-moves cache still recognizes the position"""
+        (positions, hands, points, deck, discard_pile, riders_moved, players_acted,
+         sprint_arrivals, sprint_arrival_bits, checkpoints_reached, last_move,
+         current_player_idx, game_over) = saved
+        riders = (r for p in state.players for r in p.riders)
+        for rider, position in zip(riders, positions):
+            rider.position = position
+        for player, hand, player_points in zip(state.players, hands, points):
+            player.hand[:] = hand
+            player.points = player_points
+        state.deck = deck[:]
+        state.discard_pile = discard_pile[:]
+        state.riders_moved_this_round = set(riders_moved)
+        state.players_acted_at_position = {pos: set(ids) for pos, ids in players_acted.items()}
+        state.sprint_arrivals = {pos: arrivals[:] for pos, arrivals in sprint_arrivals.items()}
+        state.sprint_arrival_bits = dict(sprint_arrival_bits)
+        state.checkpoints_reached = {rider: set(cps) for rider, cps in checkpoints_reached.items()}
+        state.last_move = last_move
+        state.current_player_idx = current_player_idx
+        state.game_over = game_over
+
+    def _transposition_key(self, state: GameState, move: Move, acted_position: int, depth: int) -> tuple:
+        """Everything that can change the result of playing `move` in `state`"""
+        last_move = state.last_move or {}
+        return (
+            depth,
+            acted_position,
+            move.action_type,
+            (move.rider.player_id, move.rider.rider_id),
+            tuple(map(self._card_values, move.cards)),
+            tuple(r.rider_id for r in move.drafting_riders),
+            tuple(r.position for p in state.players for r in p.riders),
+            tuple(p.points for p in state.players),
+            tuple(tuple(map(self._card_values, p.hand)) for p in state.players),
+            frozenset((r.player_id, r.rider_id) for r in state.riders_moved_this_round),
+            frozenset((pos, frozenset(ids)) for pos, ids in state.players_acted_at_position.items()),
+            frozenset((pos, tuple((r.player_id, r.rider_id) for r in riders))
+                      for pos, riders in state.sprint_arrivals.items()),
+            frozenset((r.player_id, r.rider_id, frozenset(cps)) for r, cps in state.checkpoints_reached.items()),
+            (last_move.get('action'), last_move.get('rider'), last_move.get('old_position'),
+             last_move.get('movement')),
+            state.el_patron,
+            len(state.deck),
+        )
+
+    def _evaluate(self, state: GameState) -> float:
+        """Our standing minus that of the strongest opponent"""
+        own = 0.0
+        opponents = []
+        for player in state.players:
+            if player.player_id == self.player_id:
+                own = self._player_value(player)
+            else:
+                opponents.append(self._player_value(player))
+        return own - max(opponents, default=0.0)
+
+    def _player_value(self, player: Player) -> float:
+        return (player.points * self.POINT_WEIGHT
+                + sum(r.position for r in player.riders) * self.POSITION_WEIGHT
+                + len(player.hand) * self.HAND_WEIGHT)
+
+    def _shared_memo(self, state: GameState) -> dict:
+        """deepcopy memo that shares the parts of the state that never change during a game"""
+        return {
+            id(state.track): state.track,
+            id(state.movement_terrain): state.movement_terrain,
+            id(state.scoring_positions): state.scoring_positions,
+            id(state.config): state.config,
+        }
 
 
 # Factory function to create agents
+_AGENT_MAP = {
+    'random': RandomAgent,
+    'marc_soler': MarcSolerAgent,
+    'wheelsucker': WheelsuckerAgent,
+    'gemini': GeminiAgent,
+    'chatgpt': ChatGPTAgent,
+    'claudebot': ClaudeBotAgent,
+    'claudebot2': ClaudeBot2Agent,
+    'tobibot': TobiBotAgent,
+    'alphabeta': AlphaBetaAgent,
+}
+
+
 def create_agent(agent_type: str, player_id: int) -> Agent:
     """Create an agent of the specified type"""
-    agent_map = {
-        'random': RandomAgent,
-        'marc_soler': MarcSolerAgent,
-        'wheelsucker': WheelsuckerAgent,
-        'gemini': GeminiAgent,
-        'chatgpt': ChatGPTAgent,
-        'claudebot': ClaudeBotAgent,
-        'claudebot2': ClaudeBot2Agent,
-        'tobibot': TobiBotAgent,
-    }
-
-    if agent_type not in agent_map:
+    cls = _AGENT_MAP.get(agent_type)
+    if cls is None:
         raise ValueError(f"Unknown agent type: {agent_type}")
-
-    return agent_map[agent_type](player_id)
+    return cls(player_id)
 
 
 def get_available_agents() -> List[str]:
     """Get list of all available agent types"""
-    return [
-        'random', 'marc_soler',
-        'wheelsucker', 'gemini', 'chatgpt', 'claudebot', 'claudebot2', 'tobibot'
-    ]
+    return list(_AGENT_MAP)
 
 
 def verify_no_wasteful_moves() -> bool:
@@ -1473,44 +1736,30 @@ def verify_no_wasteful_moves() -> bool:
     This is a self-test to ensure agents never waste cards on 0-advancement moves.
     Returns True if all agents pass, False otherwise.
     """
-    from game_state import GameState, Card
-    from game_engine import GameEngine
+    all_passed = True
+    failures = []
 
-    # Create test scenario: Sprinter on climb with only Sprinter cards
+    # Test scenario: Sprinter on climb with only Sprinter cards
     # Sprinter is terrain-limited on climbs, so moves may have 0 advancement
     state = GameState(num_players=2)
-    engine = GameEngine(state)
-
-    # Position Sprinter at middle of climb tile
-    state.players[0].riders[1].position = 14  # Sprinter
-
-    # Give player only Sprinter cards
-    state.players[0].hand = [
-        Card(CardType.SPRINTER),
-        Card(CardType.SPRINTER),
-        Card(CardType.SPRINTER),
-    ]
-
-    all_passed = True
-    failures = []
 
-    for agent_type in get_available_agents():
-        # Reset scenario for each agent
-        state = GameState(num_players=2)
+    for agent_type, agent_cls in _AGENT_MAP.items():
+        # Choosing a move leaves the state as it was; reset the scenario's rider
+        # and hand anyway, and give each agent a fresh engine (and move cache)
         engine = GameEngine(state)
-        state.players[0].riders[1].position = 14
+        state.players[0].riders[1].position = 14  # Middle of climb tile
         state.players[0].hand = [
             Card(CardType.SPRINTER),
             Card(CardType.SPRINTER),
             Card(CardType.SPRINTER),
         ]
 
-        agent = create_agent(agent_type, 0)
+        agent = agent_cls(0)
         chosen_move = agent.choose_move(engine, state.players[0])
 
         if chosen_move:
             # Free moves (Draft, TeamDraft, TeamCar) are always acceptable
-            if chosen_move.action_type in [ActionType.DRAFT, ActionType.TEAM_DRAFT, ActionType.TEAM_CAR]:
+            if chosen_move.action_type.bit & FREE_ACTIONS:
                 continue
 
             # Paid moves must have advancement > 0
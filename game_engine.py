@@ -4,8 +4,9 @@ Handles game logic, move validation, and rule enforcement
 """
 
 from typing import List, Tuple, Optional, Set, Dict
-from dataclasses import dataclass
-from game_state import GameState, Player, Rider, Card, TerrainType, CardType, PlayMode, ActionType
+from dataclasses import dataclass, field
+from game_state import (GameState, Player, Rider, Card, TerrainType, CardType, PlayMode, ActionType,
+                        SCORING_TERRAINS, DRAFT_ACTIONS, PULL_ACTIONS)
 
 
 # Terrain limits: Maps (rider_type, terrain_type) -> max fields per round on that terrain
@@ -19,50 +20,97 @@ TERRAIN_LIMITS: Dict[Tuple[CardType, TerrainType], int] = {
     (CardType.CLIMBER, TerrainType.COBBLES): 3,
 }
 
+# TERRAIN_LIMITS grouped by rider type: rider_type -> ((terrain, limit), ...)
+RIDER_TERRAIN_LIMITS: Dict[CardType, Tuple[Tuple[TerrainType, int], ...]] = {}
+for (_rider_type, _terrain), _limit in TERRAIN_LIMITS.items():
+    RIDER_TERRAIN_LIMITS[_rider_type] = RIDER_TERRAIN_LIMITS.get(_rider_type, ()) + ((_terrain, _limit),)
+del _rider_type, _terrain, _limit
 
-@dataclass
+# TERRAIN_LIMITS as a table indexed by [rider_type.index][terrain.index] (None if no limit)
+TERRAIN_LIMIT_TABLE: List[List[Optional[int]]] = [
+    [TERRAIN_LIMITS.get((rider_type, terrain)) for terrain in TerrainType] for rider_type in CardType
+]
+
+# last_move['action'] values a Draft can follow
+DRAFTABLE_ACTION_NAMES = frozenset(action_type.value for action_type in (
+    ActionType.PULL, ActionType.DRAFT, ActionType.TEAM_PULL, ActionType.TEAM_DRAFT))
+
+
+@dataclass(slots=True)
 class Move:
     """Represents a player's action (Pull, Attack, Draft, TeamCar, TeamPull, TeamDraft)"""
     action_type: ActionType
     rider: Rider  # Primary rider (for Pull, Attack, Draft, TeamCar) or lead rider (for TeamPull, TeamDraft)
     cards: List[Card]  # 1-3 cards for Pull/Attack, 1 card for TeamCar (card to discard), empty for Draft/TeamDraft
     drafting_riders: List[Rider] = None  # For TeamPull and TeamDraft: additional riders that draft
+    # Precomputed by GameEngine.get_valid_moves (before terrain limits):
+    distance: Optional[int] = field(default=None, compare=False)  # Fields moved by each rider
+    advancement: Optional[int] = field(default=None, compare=False)  # Total fields for all riders
+    card_type_mask: Optional[int] = field(default=None, compare=False)  # OR of the cards' CardType bits
     
     def __post_init__(self):
         """Validate the move"""
         if self.drafting_riders is None:
             self.drafting_riders = []
             
-        if self.action_type == ActionType.PULL:
+        if self.action_type is ActionType.PULL:
             assert 1 <= len(self.cards) <= 3, "Pull requires 1-3 cards"
-        elif self.action_type == ActionType.ATTACK:
+        elif self.action_type is ActionType.ATTACK:
             assert len(self.cards) == 3, "Attack requires exactly 3 cards"
-        elif self.action_type == ActionType.TEAM_CAR:
+        elif self.action_type is ActionType.TEAM_CAR:
             assert len(self.cards) <= 1, "Team Car can specify 0 or 1 card to discard"
-        elif self.action_type == ActionType.TEAM_PULL:
+        elif self.action_type is ActionType.TEAM_PULL:
             assert 1 <= len(self.cards) <= 3, "TeamPull requires 1-3 cards for the pull"
             assert len(self.drafting_riders) >= 1, "TeamPull requires at least 1 drafting rider"
-        elif self.action_type == ActionType.TEAM_DRAFT:
+        elif self.action_type is ActionType.TEAM_DRAFT:
             assert len(self.cards) == 0, "TeamDraft does not use cards"
             assert len(self.drafting_riders) >= 1, "TeamDraft requires at least 1 additional drafting rider"
 
 
+def card_type_mask(cards: List[Card]) -> int:
+    """Bitmask of the card types in `cards` (OR of CardType.bit)"""
+    mask = 0
+    for card in cards:
+        mask |= card.card_type.bit
+    return mask
+
+
 class GameEngine:
     """Handles game logic and rules"""
 
     def __init__(self, game_state: GameState):
         self.state = game_state
+        # Most recent get_valid_moves() result: (key, pinned objects, moves,
+        # first TeamCar move, whether a Draft/TeamDraft is available,
+        # moves by rider, moves by action type).
+        # Reused while the key (see _valid_moves_key) is unchanged.
+        self._valid_moves_cache: Optional[Tuple] = None
+        # Indexed by rider_type.index: (limits, slot per position, movement memo), see _build_limit_slots
+        self._limit_slots = self._build_limit_slots()
+
+    def _build_limit_slots(self) -> List[Optional[Tuple[Tuple[int, ...], List[int], Dict[Tuple[int, int], int]]]]:
+        """Precompute terrain limits per rider type as plain ints.
+
+        The result is indexed by rider_type.index (None for rider types without
+        terrain limits). For each limited rider type, the slot list holds, per
+        track position, the index into that rider's limits of the terrain there
+        (-1 if that terrain is unlimited), so the movement walk only compares ints.
+        The memo caches walk results by (start position, base movement); the
+        track never changes, so entries stay valid for the engine's lifetime.
+        """
+        limit_slots = [None] * len(CardType)
+        for rider_type, terrain_limits in RIDER_TERRAIN_LIMITS.items():
+            slot_of = {terrain: i for i, (terrain, _) in enumerate(terrain_limits)}
+            slots = [slot_of.get(terrain, -1) for terrain in self.state.movement_terrain]
+            limit_slots[rider_type.index] = (tuple(limit for _, limit in terrain_limits), slots, {})
+        return limit_slots
 
     def _get_terrain_at_position(self, position: int) -> TerrainType:
         """Get the terrain type at a position, treating SPRINT/FINISH as FLAT"""
-        tile = self.state.get_tile_at_position(position)
-        if not tile:
-            return TerrainType.FLAT
-        terrain = tile.terrain
-        # SPRINT and FINISH are treated as FLAT for movement purposes
-        if terrain in [TerrainType.SPRINT, TerrainType.FINISH]:
-            return TerrainType.FLAT
-        return terrain
+        movement_terrain = self.state.movement_terrain
+        if 0 <= position < len(movement_terrain):
+            return movement_terrain[position]
+        return TerrainType.FLAT
 
     def _calculate_limited_movement(self, rider: Rider, start_position: int, base_movement: int) -> int:
         """Calculate actual movement considering terrain limits.
@@ -79,42 +127,30 @@ class GameEngine:
         Returns:
             The actual number of fields the rider can move (may be less than base_movement)
         """
-        rider_type = rider.rider_type
-
-        # Track how many fields we've moved on each limited terrain type
-        limited_terrain_counts: Dict[TerrainType, int] = {}
-
-        # Initialize counters for terrains that have limits for this rider
-        for (card_type, terrain), limit in TERRAIN_LIMITS.items():
-            if card_type == rider_type:
-                limited_terrain_counts[terrain] = 0
+        limit_slots = self._limit_slots[rider.rider_type.index]
 
         # If this rider has no terrain limits, return base movement
-        if not limited_terrain_counts:
+        if limit_slots is None:
             return base_movement
-
-        # Walk through each field one by one
+        limits, slots, memo = limit_slots
+        key = (start_position, base_movement)
+        actual_movement = memo.get(key)
+        if actual_movement is not None:
+            return actual_movement
+
+        # Walk through each field one by one (the slice stops at the track end),
+        # counting fields moved on each limited terrain
+        counts = [0] * len(limits)
         actual_movement = 0
-        for step in range(base_movement):
-            next_position = start_position + actual_movement + 1
-
-            # Don't move past track end
-            if next_position >= self.state.track_length:
-                actual_movement = self.state.track_length - 1 - start_position
-                break
-
-            terrain = self._get_terrain_at_position(next_position)
-
-            # Check if this terrain is limited for this rider
-            if terrain in limited_terrain_counts:
-                limit = TERRAIN_LIMITS.get((rider_type, terrain))
-                if limit is not None and limited_terrain_counts[terrain] >= limit:
+        for slot in slots[start_position + 1:start_position + 1 + base_movement]:
+            if slot >= 0:
+                if counts[slot] >= limits[slot]:
                     # We've hit the limit for this terrain, stop here
                     break
-                limited_terrain_counts[terrain] += 1
-
+                counts[slot] += 1
             actual_movement += 1
 
+        memo[key] = actual_movement
         return actual_movement
     
     def get_valid_moves(self, player: Player, eligible_riders: List[Rider] = None) -> List[Move]:
@@ -124,9 +160,64 @@ class GameEngine:
             player: The player whose turn it is
             eligible_riders: If provided, only generate moves for these riders (unmoved this round).
                             If None, generates for all riders (backward compat).
+
+        The result is cached and reused while the player's hand, the riders' positions
+        and the last move are unchanged, so repeated calls within a turn are cheap.
+        A fresh list is returned on every call.
         """
-        valid_moves = []
         riders_to_move = eligible_riders if eligible_riders is not None else player.riders
+        return list(self._get_valid_moves_entry(player, riders_to_move)[2])
+
+    def team_car_move(self, player: Player, eligible_riders: List[Rider] = None) -> Optional[Move]:
+        """The first TeamCar move among the valid moves (None if there is none)"""
+        riders_to_move = eligible_riders if eligible_riders is not None else player.riders
+        return self._get_valid_moves_entry(player, riders_to_move)[3]
+
+    def team_car_move_if_needed(self, player: Player, eligible_riders: List[Rider] = None,
+                                hand_threshold: int = 3) -> Optional[Move]:
+        """The TeamCar move to play when the hand is low and no draft is available, else None
+
+        Same rule as agents.should_use_team_car, answered from the valid-moves cache.
+        """
+        if len(player.hand) >= hand_threshold:
+            return None
+        riders_to_move = eligible_riders if eligible_riders is not None else player.riders
+        entry = self._get_valid_moves_entry(player, riders_to_move)
+        has_draft = entry[4]
+        return None if has_draft else entry[3]
+
+    def rider_moves(self, player: Player, rider: Rider, eligible_riders: List[Rider] = None) -> List[Move]:
+        """The valid moves led by the given rider, answered from the valid-moves cache"""
+        riders_to_move = eligible_riders if eligible_riders is not None else player.riders
+        return list(self._get_valid_moves_entry(player, riders_to_move)[5].get(rider, ()))
+
+    def action_moves(self, player: Player, action_type: ActionType,
+                     eligible_riders: List[Rider] = None) -> List[Move]:
+        """The valid moves of the given action type, answered from the valid-moves cache"""
+        riders_to_move = eligible_riders if eligible_riders is not None else player.riders
+        return list(self._get_valid_moves_entry(player, riders_to_move)[6].get(action_type, ()))
+
+    def _get_valid_moves_entry(self, player: Player, riders_to_move: List[Rider]) -> Tuple:
+        """Return the valid-moves cache entry for this turn, generating the moves if needed"""
+        cache_key = self._valid_moves_key(player, riders_to_move)
+        if self._valid_moves_cache is None or self._valid_moves_cache[0] != cache_key:
+            valid_moves = self._generate_valid_moves(player, riders_to_move)
+            team_car = next((m for m in valid_moves if m.action_type is ActionType.TEAM_CAR), None)
+            has_draft = any(m.action_type.bit & DRAFT_ACTIONS for m in valid_moves)
+            moves_by_rider = {}
+            moves_by_action = {}
+            for m in valid_moves:
+                moves_by_rider.setdefault(m.rider, []).append(m)
+                moves_by_action.setdefault(m.action_type, []).append(m)
+            # Pin the objects whose ids make up the key so the ids can't be reused while cached
+            pinned = (player, tuple(riders_to_move), tuple(player.hand), self.state.last_move)
+            self._valid_moves_cache = (cache_key, pinned, valid_moves, team_car, has_draft,
+                                      moves_by_rider, moves_by_action)
+        return self._valid_moves_cache
+
+    def _generate_valid_moves(self, player: Player, riders_to_move: List[Rider]) -> List[Move]:
+        """Generate all valid moves for the given riders of a player"""
+        valid_moves = []
 
         # Generate moves for each eligible rider
         for rider in riders_to_move:
@@ -154,8 +245,61 @@ class GameEngine:
         for rider in riders_to_move:
             valid_moves.append(Move(ActionType.TEAM_CAR, rider, []))
 
+        # A rider's Pull and the TeamPulls it leads with the same cards (one move per
+        # set of drafters) move the same distance, so their distance and card mask
+        # are computed once per rider and cards
+        pull_memo = {}
+        for move in valid_moves:
+            if move.action_type.bit & PULL_ACTIONS:
+                key = (id(move.rider), tuple(map(id, move.cards)))
+                memo = pull_memo.get(key)
+                if memo is None:
+                    memo = pull_memo[key] = (
+                        card_type_mask(move.cards), self._calculate_move_distance(move))
+                move.card_type_mask, move.distance = memo
+            else:
+                move.card_type_mask = card_type_mask(move.cards)
+                move.distance = self._calculate_move_distance(move)
+            move.advancement = move.distance * (1 + len(move.drafting_riders))
+
         return valid_moves
+
+    def _valid_moves_key(self, player: Player, riders: List[Rider]) -> Tuple:
+        """Build the cache key for get_valid_moves.
+
+        Valid moves depend only on the player's hand (by card identity, since moves
+        reference the exact Card objects), the moving riders and their positions,
+        and the last move (for drafting).
+        """
+        return (
+            id(player),
+            tuple(id(r) for r in riders),
+            tuple(r.position for r in riders),
+            tuple(id(c) for c in player.hand),
+            id(self.state.last_move),
+        )
     
+    def _calculate_move_distance(self, move: Move) -> int:
+        """Calculate how far a move advances each of its riders, before terrain limits"""
+        if move.action_type.bit & PULL_ACTIONS:
+            return self._calculate_pull_movement(move.rider, move.cards)
+        elif move.action_type is ActionType.ATTACK:
+            return self._calculate_attack_movement(move.rider, move.cards)
+        elif move.action_type.bit & DRAFT_ACTIONS:
+            # Drafting copies movement from last move
+            if self.state.last_move:
+                return self.state.last_move.get('movement', 0)
+        return 0  # TeamCar: no movement
+
+    def _calculate_advancement(self, move: Move) -> int:
+        """Calculate total advancement for all riders affected by a move
+
+        For single rider moves (Pull, Attack, Draft): returns distance moved
+        For team moves (TeamPull, TeamDraft): returns distance × number of riders
+        For TeamCar: returns 0 (no advancement)
+        """
+        return self._calculate_move_distance(move) * (1 + len(move.drafting_riders))
+
     def _get_pull_moves(self, rider: Rider, player: Player) -> List[Move]:
         """Generate all valid Pull moves for a rider (1-3 cards)"""
         moves = []
@@ -170,7 +314,7 @@ class GameEngine:
         # Generate combinations: 1 card, 2 cards, or 3 cards
         from itertools import combinations
         
-        for num_cards in [1, 2, 3]:
+        for num_cards in (1, 2, 3):
             if len(eligible_cards) >= num_cards:
                 for card_combo in combinations(range(len(eligible_cards)), num_cards):
                     cards = [eligible_cards[i] for i in card_combo]
@@ -186,26 +330,22 @@ class GameEngine:
         if len(player.hand) < 3:
             return moves
         
-        # Get eligible cards
-        matching_rider_cards = [c for c in player.hand if c.card_type == rider.rider_type]
-        energy_cards = [c for c in player.hand if c.is_energy_card()]
+        # Get eligible cards (matching rider cards + energy), keeping hand order
+        rider_bit = rider.rider_type.bit
+        eligible_bits = rider_bit | CardType.ENERGY.bit
+        eligible_cards = [c for c in player.hand if c.card_type.bit & eligible_bits]
         
         # Must have at least 1 matching rider card
-        if not matching_rider_cards:
+        if not any(c.card_type.bit & rider_bit for c in eligible_cards):
             return moves
         
-        # Generate all 3-card combinations from hand
+        # Generate all 3-card combinations of eligible cards
         from itertools import combinations
         
-        for card_combo in combinations(player.hand, 3):
-            cards = list(card_combo)
-            # Check if at least one card matches the rider type
-            has_matching_card = any(c.card_type == rider.rider_type for c in cards)
-            # Check if all cards are eligible (matching rider card or energy)
-            all_eligible = all(c.is_energy_card() or c.card_type == rider.rider_type for c in cards)
-            
-            if has_matching_card and all_eligible:
-                moves.append(Move(ActionType.ATTACK, rider, cards))
+        for card_combo in combinations(eligible_cards, 3):
+            # At least one card must match the rider type
+            if card_type_mask(card_combo) & rider_bit:
+                moves.append(Move(ActionType.ATTACK, rider, list(card_combo)))
         
         return moves
     
@@ -225,7 +365,7 @@ class GameEngine:
 
         last_action = self.state.last_move.get('action')
         # Check if last move was one of the allowed types
-        if last_action not in ['Pull', 'Draft', 'TeamPull', 'TeamDraft']:
+        if last_action not in DRAFTABLE_ACTION_NAMES:
             return moves
 
         # Check if last move was by a different rider (not the same rider)
@@ -308,7 +448,7 @@ class GameEngine:
             return moves
 
         last_action = self.state.last_move.get('action')
-        if last_action not in ['Pull', 'Draft', 'TeamPull', 'TeamDraft']:
+        if last_action not in DRAFTABLE_ACTION_NAMES:
             return moves
 
         # Find the starting position of the last move
@@ -359,25 +499,25 @@ class GameEngine:
         old_terrain = old_tile.terrain.value if old_tile else "Unknown"
         
         # Calculate movement based on action type
-        if move.action_type == ActionType.PULL:
+        if move.action_type is ActionType.PULL:
             base_movement = self._calculate_pull_movement(move.rider, move.cards)
             action_name = "Pull"
-        elif move.action_type == ActionType.ATTACK:
+        elif move.action_type is ActionType.ATTACK:
             base_movement = self._calculate_attack_movement(move.rider, move.cards)
             action_name = "Attack"
-        elif move.action_type == ActionType.DRAFT:
+        elif move.action_type is ActionType.DRAFT:
             # Draft: copy the movement from the last Pull/Draft/TeamPull/TeamDraft move
-            if not self.state.last_move or self.state.last_move.get('action') not in ['Pull', 'Draft', 'TeamPull', 'TeamDraft']:
+            if not self.state.last_move or self.state.last_move.get('action') not in DRAFTABLE_ACTION_NAMES:
                 return {'success': False, 'error': 'Cannot draft - no valid move to follow'}
             base_movement = self.state.last_move.get('movement', 0)
             action_name = "Draft"
-        elif move.action_type == ActionType.TEAM_PULL:
+        elif move.action_type is ActionType.TEAM_PULL:
             # TeamPull: Execute Pull for lead rider, then draft for teammates
             return self._execute_team_pull(move, player, old_position, old_terrain)
-        elif move.action_type == ActionType.TEAM_DRAFT:
+        elif move.action_type is ActionType.TEAM_DRAFT:
             # TeamDraft: Multiple riders draft together
             return self._execute_team_draft(move, player, old_position, old_terrain)
-        elif move.action_type == ActionType.TEAM_CAR:
+        elif move.action_type is ActionType.TEAM_CAR:
             # Team Car: Draw 2 cards, discard 1 card
             result = self._execute_team_car(move, player, old_position, old_terrain)
             # Update last_move tracking
@@ -402,9 +542,9 @@ class GameEngine:
             player.hand.remove(card)
             self.state.discard_pile.append(card)
         
-        # Check for sprint points on ALL positions crossed (not just the final position)
+        # Check for sprint points on every sprint/finish crossed (not just the final position)
         points_earned = 0
-        for pos in range(old_position + 1, new_position + 1):
+        for pos in self.state.scoring_positions_crossed(old_position, new_position):
             points = self._check_sprint_scoring(move.rider, pos)
             points_earned += points
         
@@ -416,19 +556,18 @@ class GameEngine:
         checkpoints_reached = []
 
         # Check all checkpoints from old position to new position
-        for checkpoint in range(10, new_position + 1, 10):
-            if checkpoint > old_position and not self.state.has_rider_reached_checkpoint(move.rider, checkpoint):
-                # This is a new checkpoint for this rider
-                self.state.mark_checkpoint_reached(move.rider, checkpoint)
-                checkpoints_reached.append(checkpoint)
-
-                # Draw cards for this checkpoint (amount depends on checkpoint position)
-                num_cards_to_draw = self.state.config.checkpoints.get_cards_for_checkpoint(checkpoint)
-                for _ in range(num_cards_to_draw):
-                    new_card = self.state.draw_card()
-                    if new_card:
-                        player.hand.append(new_card)
-                        cards_drawn += 1
+        for checkpoint in self.state.new_checkpoints(move.rider, old_position, new_position):
+            # This is a new checkpoint for this rider
+            self.state.mark_checkpoint_reached(move.rider, checkpoint)
+            checkpoints_reached.append(checkpoint)
+
+            # Draw cards for this checkpoint (amount depends on checkpoint position)
+            num_cards_to_draw = self.state.config.checkpoints.get_cards_for_checkpoint(checkpoint)
+            for _ in range(num_cards_to_draw):
+                new_card = self.state.draw_card()
+                if new_card:
+                    player.hand.append(new_card)
+                    cards_drawn += 1
         
         result = {
             'success': True,
@@ -454,35 +593,20 @@ class GameEngine:
     
     def _calculate_pull_movement(self, rider: Rider, cards: List[Card]) -> int:
         """Calculate total movement for a Pull action"""
-        current_tile = self.state.get_tile_at_position(rider.position)
-        if not current_tile:
-            return 0
-        
-        total = 0
-        for card in cards:
-            if card.is_energy_card():
-                total += 1
-            else:
-                # Use Pull values
-                total += card.get_movement(current_tile.terrain, PlayMode.PULL)
-        
-        return total
+        return self._calculate_card_movement(rider, cards, PlayMode.PULL)
     
     def _calculate_attack_movement(self, rider: Rider, cards: List[Card]) -> int:
         """Calculate total movement for an Attack action"""
-        current_tile = self.state.get_tile_at_position(rider.position)
-        if not current_tile:
+        return self._calculate_card_movement(rider, cards, PlayMode.ATTACK)
+
+    def _calculate_card_movement(self, rider: Rider, cards: List[Card], play_mode: PlayMode) -> int:
+        """Total movement of cards played in play_mode on the rider's field (Energy moves 1)"""
+        movement_terrain = self.state.movement_terrain
+        position = rider.position
+        if not 0 <= position < len(movement_terrain):
             return 0
-        
-        total = 0
-        for card in cards:
-            if card.is_energy_card():
-                total += 1
-            else:
-                # Use Attack values
-                total += card.get_movement(current_tile.terrain, PlayMode.ATTACK)
-        
-        return total
+        terrain = movement_terrain[position]
+        return sum(card.get_movement(terrain, play_mode) for card in cards)
     
     def _execute_team_car(self, move: Move, player: Player, old_position: int, old_terrain: str) -> dict:
         """Execute Team Car action: Draw 2 cards first, then discard 1 card"""
@@ -579,7 +703,7 @@ class GameEngine:
         points_earned = 0
 
         # Lead rider
-        for pos in range(old_position + 1, new_position + 1):
+        for pos in self.state.scoring_positions_crossed(old_position, new_position):
             points = self._check_sprint_scoring(move.rider, pos)
             points_earned += points
 
@@ -590,7 +714,7 @@ class GameEngine:
             drafter_rider = next((r for r in player.riders
                                  if f"P{r.player_id}R{r.rider_id}" == drafter_info['rider']), None)
             if drafter_rider:
-                for pos in range(drafter_old_pos + 1, drafter_new_pos + 1):
+                for pos in self.state.scoring_positions_crossed(drafter_old_pos, drafter_new_pos):
                     points = self._check_sprint_scoring(drafter_rider, pos)
                     points_earned += points
 
@@ -602,19 +726,18 @@ class GameEngine:
         checkpoints_reached = []
         
         # Check lead rider
-        for checkpoint in range(10, new_position + 1, 10):
-            if checkpoint > old_position and not self.state.has_rider_reached_checkpoint(move.rider, checkpoint):
-                self.state.mark_checkpoint_reached(move.rider, checkpoint)
-                if checkpoint not in checkpoints_reached:
-                    checkpoints_reached.append(checkpoint)
-
-                # Draw cards for this checkpoint (amount depends on checkpoint position)
-                num_cards_to_draw = self.state.config.checkpoints.get_cards_for_checkpoint(checkpoint)
-                for _ in range(num_cards_to_draw):
-                    new_card = self.state.draw_card()
-                    if new_card:
-                        player.hand.append(new_card)
-                        cards_drawn += 1
+        for checkpoint in self.state.new_checkpoints(move.rider, old_position, new_position):
+            self.state.mark_checkpoint_reached(move.rider, checkpoint)
+            if checkpoint not in checkpoints_reached:
+                checkpoints_reached.append(checkpoint)
+
+            # Draw cards for this checkpoint (amount depends on checkpoint position)
+            num_cards_to_draw = self.state.config.checkpoints.get_cards_for_checkpoint(checkpoint)
+            for _ in range(num_cards_to_draw):
+                new_card = self.state.draw_card()
+                if new_card:
+                    player.hand.append(new_card)
+                    cards_drawn += 1
         
         # Check each drafting rider
         for drafter_info in drafting_results:
@@ -626,19 +749,18 @@ class GameEngine:
                                  if f"P{r.player_id}R{r.rider_id}" == drafter_info['rider']), None)
             
             if drafter_rider:
-                for checkpoint in range(10, drafter_new_pos + 1, 10):
-                    if checkpoint > drafter_old_pos and not self.state.has_rider_reached_checkpoint(drafter_rider, checkpoint):
-                        self.state.mark_checkpoint_reached(drafter_rider, checkpoint)
-                        if checkpoint not in checkpoints_reached:
-                            checkpoints_reached.append(checkpoint)
-
-                        # Draw cards for this checkpoint (amount depends on checkpoint position)
-                        num_cards_to_draw = self.state.config.checkpoints.get_cards_for_checkpoint(checkpoint)
-                        for _ in range(num_cards_to_draw):
-                            new_card = self.state.draw_card()
-                            if new_card:
-                                player.hand.append(new_card)
-                                cards_drawn += 1
+                for checkpoint in self.state.new_checkpoints(drafter_rider, drafter_old_pos, drafter_new_pos):
+                    self.state.mark_checkpoint_reached(drafter_rider, checkpoint)
+                    if checkpoint not in checkpoints_reached:
+                        checkpoints_reached.append(checkpoint)
+
+                    # Draw cards for this checkpoint (amount depends on checkpoint position)
+                    num_cards_to_draw = self.state.config.checkpoints.get_cards_for_checkpoint(checkpoint)
+                    for _ in range(num_cards_to_draw):
+                        new_card = self.state.draw_card()
+                        if new_card:
+                            player.hand.append(new_card)
+                            cards_drawn += 1
         
         result = {
             'success': True,
@@ -669,7 +791,7 @@ class GameEngine:
         different positions even though they're drafting together.
         """
         # Get base movement from last Pull/Draft/TeamPull/TeamDraft
-        if not self.state.last_move or self.state.last_move.get('action') not in ['Pull', 'Draft', 'TeamPull', 'TeamDraft']:
+        if not self.state.last_move or self.state.last_move.get('action') not in DRAFTABLE_ACTION_NAMES:
             return {'success': False, 'error': 'Cannot draft - no valid move to follow'}
 
         base_draft_movement = self.state.last_move.get('movement', 0)
@@ -704,7 +826,7 @@ class GameEngine:
             drafter_rider = next((r for r in player.riders
                                  if f"P{r.player_id}R{r.rider_id}" == drafter_info['rider']), None)
             if drafter_rider:
-                for pos in range(drafter_old_pos + 1, drafter_new_pos + 1):
+                for pos in self.state.scoring_positions_crossed(drafter_old_pos, drafter_new_pos):
                     points = self._check_sprint_scoring(drafter_rider, pos)
                     points_earned += points
 
@@ -725,19 +847,18 @@ class GameEngine:
                                  if f"P{r.player_id}R{r.rider_id}" == drafter_info['rider']), None)
             
             if drafter_rider:
-                for checkpoint in range(10, drafter_new_pos + 1, 10):
-                    if checkpoint > drafter_old_pos and not self.state.has_rider_reached_checkpoint(drafter_rider, checkpoint):
-                        self.state.mark_checkpoint_reached(drafter_rider, checkpoint)
-                        if checkpoint not in checkpoints_reached:
-                            checkpoints_reached.append(checkpoint)
-
-                        # Draw cards for this checkpoint (amount depends on checkpoint position)
-                        num_cards_to_draw = self.state.config.checkpoints.get_cards_for_checkpoint(checkpoint)
-                        for _ in range(num_cards_to_draw):
-                            new_card = self.state.draw_card()
-                            if new_card:
-                                player.hand.append(new_card)
-                                cards_drawn += 1
+                for checkpoint in self.state.new_checkpoints(drafter_rider, drafter_old_pos, drafter_new_pos):
+                    self.state.mark_checkpoint_reached(drafter_rider, checkpoint)
+                    if checkpoint not in checkpoints_reached:
+                        checkpoints_reached.append(checkpoint)
+
+                    # Draw cards for this checkpoint (amount depends on checkpoint position)
+                    num_cards_to_draw = self.state.config.checkpoints.get_cards_for_checkpoint(checkpoint)
+                    for _ in range(num_cards_to_draw):
+                        new_card = self.state.draw_card()
+                        if new_card:
+                            player.hand.append(new_card)
+                            cards_drawn += 1
         
         result = {
             'success': True,
@@ -770,25 +891,26 @@ class GameEngine:
         """
         tile = self.state.get_tile_at_position(position)
         
-        if not tile or tile.terrain not in [TerrainType.SPRINT, TerrainType.FINISH]:
+        if not tile or tile.terrain not in SCORING_TERRAINS:
             return 0
         
         if not tile.sprint_points:
             return 0
         
         # Track arrival order at this sprint
-        if position not in self.state.sprint_arrivals:
-            self.state.sprint_arrivals[position] = []
+        arrivals = self.state.sprint_arrivals.setdefault(position, [])
         
         # Check if this rider has already been recorded at this sprint
-        if rider in self.state.sprint_arrivals[position]:
+        arrival_bits = self.state.sprint_arrival_bits.get(position, 0)
+        if arrival_bits & rider.bit:
             return 0  # Already scored here
         
         # Record this rider's arrival
-        self.state.sprint_arrivals[position].append(rider)
+        arrivals.append(rider)
+        self.state.sprint_arrival_bits[position] = arrival_bits | rider.bit
         
         # Determine scoring position (0-indexed)
-        scoring_position = len(self.state.sprint_arrivals[position]) - 1
+        scoring_position = len(arrivals) - 1
         
         # Award points if within scoring positions
         if scoring_position < len(tile.sprint_points):
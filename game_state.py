@@ -3,14 +3,28 @@ Chasse Patate - Game State Management
 Handles all game state, cards, and rules
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Set, Tuple
 from enum import Enum
+from operator import attrgetter
 import random
 from game_config import GameConfig, get_config
 
 
-class CardType(Enum):
+class _IndexedEnum(Enum):
+    """Enum whose members also carry a dense index (0, 1, 2, ...) and a bit (1 << index)
+
+    The string values stay as they are (they appear in logs and the UI); the
+    index and bit allow table lookups and bitmask tests without hashing.
+    """
+
+    def __init__(self, *args):
+        self.index = len(type(self).__members__)
+        self.bit = 1 << self.index
+
+
+class CardType(_IndexedEnum):
     """Types of cards"""
     ENERGY = "Energy"
     ROULEUR = "Rouleur"
@@ -18,13 +32,13 @@ class CardType(Enum):
     CLIMBER = "Climber"
 
 
-class PlayMode(Enum):
+class PlayMode(_IndexedEnum):
     """Card play modes"""
     PULL = "Pull"
     ATTACK = "Attack"
 
 
-class ActionType(Enum):
+class ActionType(_IndexedEnum):
     """Types of actions a player can take"""
     PULL = "Pull"
     ATTACK = "Attack"
@@ -34,7 +48,14 @@ class ActionType(Enum):
     TEAM_DRAFT = "TeamDraft"  # Multiple riders draft together
 
 
-class TerrainType(Enum):
+# Groups of action types as ActionType.bit masks (test with `action_type.bit & MASK`)
+DRAFT_ACTIONS = ActionType.DRAFT.bit | ActionType.TEAM_DRAFT.bit
+FREE_ACTIONS = DRAFT_ACTIONS | ActionType.TEAM_CAR.bit  # Actions that play no cards
+TEAM_ACTIONS = ActionType.TEAM_PULL.bit | ActionType.TEAM_DRAFT.bit  # Moves with drafting riders
+PULL_ACTIONS = ActionType.PULL.bit | ActionType.TEAM_PULL.bit
+
+
+class TerrainType(_IndexedEnum):
     """Types of terrain"""
     FLAT = "Flat"
     COBBLES = "Cobbles"
@@ -44,7 +65,26 @@ class TerrainType(Enum):
     FINISH = "Finish"  # Special marker for finish line
 
 
-@dataclass
+# Terrains that award points to arriving riders (and count as FLAT for movement)
+SCORING_TERRAINS = frozenset({TerrainType.SPRINT, TerrainType.FINISH})
+
+# Card movement field suffix per terrain (Sprint/Finish use flat values)
+_MOVEMENT_TERRAIN_FIELDS = {
+    TerrainType.FLAT: 'flat',
+    TerrainType.COBBLES: 'cobbles',
+    TerrainType.CLIMB: 'climb',
+    TerrainType.DESCENT: 'descent',
+    TerrainType.SPRINT: 'flat',
+    TerrainType.FINISH: 'flat',
+}
+# Getters for Card.get_movement, indexed by [play_mode.index][terrain.index]
+_MOVEMENT_GETTERS = [
+    [attrgetter(f'{mode.name.lower()}_{_MOVEMENT_TERRAIN_FIELDS[terrain]}') for terrain in TerrainType]
+    for mode in PlayMode
+]
+
+
+@dataclass(slots=True)
 class Card:
     """Represents a card that can be played"""
     card_type: CardType
@@ -77,35 +117,11 @@ class Card:
         if self.is_energy_card():
             return 1
         
-        # Handle special terrain types (Sprint/Finish use flat values)
-        actual_terrain = terrain
-        if terrain in [TerrainType.SPRINT, TerrainType.FINISH]:
-            actual_terrain = TerrainType.FLAT
-        
-        # Select the appropriate mode and terrain
-        if play_mode == PlayMode.PULL:
-            if actual_terrain == TerrainType.FLAT:
-                return self.pull_flat if self.pull_flat is not None else 0
-            elif actual_terrain == TerrainType.COBBLES:
-                return self.pull_cobbles if self.pull_cobbles is not None else 0
-            elif actual_terrain == TerrainType.CLIMB:
-                return self.pull_climb if self.pull_climb is not None else 0
-            elif actual_terrain == TerrainType.DESCENT:
-                return self.pull_descent if self.pull_descent is not None else 0
-        else:  # PlayMode.ATTACK
-            if actual_terrain == TerrainType.FLAT:
-                return self.attack_flat if self.attack_flat is not None else 0
-            elif actual_terrain == TerrainType.COBBLES:
-                return self.attack_cobbles if self.attack_cobbles is not None else 0
-            elif actual_terrain == TerrainType.CLIMB:
-                return self.attack_climb if self.attack_climb is not None else 0
-            elif actual_terrain == TerrainType.DESCENT:
-                return self.attack_descent if self.attack_descent is not None else 0
-        
-        return 0
+        value = _MOVEMENT_GETTERS[play_mode.index][terrain.index](self)
+        return value if value is not None else 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Rider:
     """Represents a rider on the track"""
     player_id: int
@@ -122,6 +138,11 @@ class Rider:
     
     def __hash__(self):
         return hash((self.player_id, self.rider_id))
+
+    @property
+    def bit(self) -> int:
+        """A bit of its own for this rider among all riders (rider_id is 0-2)"""
+        return 1 << (self.player_id * 3 + self.rider_id)
     
     def __eq__(self, other):
         if isinstance(other, Rider):
@@ -195,7 +216,7 @@ class Player:
             self.riders = [Rider(self.player_id, i) for i in range(3)]
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackTile:
     """Represents a tile on the track"""
     position: int
@@ -283,6 +304,17 @@ class GameState:
         
         # Create track from tiles
         self.track = self._create_track_from_tiles(tile_config)
+
+        # Terrain used for movement at each position, indexed by position
+        # (SPRINT and FINISH fields count as FLAT for movement)
+        self.movement_terrain: List[TerrainType] = [
+            TerrainType.FLAT if tile.terrain in SCORING_TERRAINS else tile.terrain
+            for tile in self.track
+        ]
+        # Sprint and finish positions, ascending
+        self.scoring_positions: List[int] = [
+            pos for pos, tile in enumerate(self.track) if tile.terrain in SCORING_TERRAINS
+        ]
         
         # Deal initial hands according to rules
         self._deal_initial_hands()
@@ -296,6 +328,8 @@ class GameState:
         # Sprint arrival tracking: track order of arrival at each sprint point
         # Key = position, Value = list of riders in arrival order
         self.sprint_arrivals: Dict[int, List[Rider]] = {}
+        # Same arrivals as a bitmask of Rider.bit per position, for membership tests
+        self.sprint_arrival_bits: Dict[int, int] = {}
         
         # Track last move for drafting eligibility
         # Stores the most recent move result from execute_move()
@@ -405,6 +439,11 @@ class GameState:
             return self.track[position]
         return None
     
+    def scoring_positions_crossed(self, old_pos: int, new_pos: int) -> List[int]:
+        """Sprint and finish positions a rider passes moving from old_pos to new_pos (in track order)"""
+        positions = self.scoring_positions
+        return positions[bisect_right(positions, old_pos):bisect_right(positions, new_pos)]
+
     def get_riders_at_position(self, position: int) -> List[Rider]:
         """Get all riders at a specific position"""
         riders = []
@@ -414,6 +453,17 @@ class GameState:
                     riders.append(rider)
         return riders
     
+    def get_riders_by_position(self) -> Dict[int, List[Rider]]:
+        """Get all riders grouped by position (same order as get_riders_at_position)
+
+        Use this instead of repeated get_riders_at_position calls, which each scan every rider.
+        """
+        riders_by_position = {}
+        for player in self.players:
+            for rider in player.riders:
+                riders_by_position.setdefault(rider.position, []).append(rider)
+        return riders_by_position
+    
     def get_rider_positions(self) -> Dict[Rider, int]:
         """Get positions of all riders"""
         positions = {}
@@ -679,46 +729,17 @@ class GameState:
     
     def _get_hand_breakdown(self, player: Player) -> Dict:
         """Get detailed breakdown of a player's hand"""
-        breakdown = {
-            'energy': 0,
-            'rouleur': 0,
-            'sprinter': 0,
-            'climber': 0,
-            'total': len(player.hand)
-        }
-        
-        for card in player.hand:
-            if card.card_type == CardType.ENERGY:
-                breakdown['energy'] += 1
-            elif card.card_type == CardType.ROULEUR:
-                breakdown['rouleur'] += 1
-            elif card.card_type == CardType.SPRINTER:
-                breakdown['sprinter'] += 1
-            elif card.card_type == CardType.CLIMBER:
-                breakdown['climber'] += 1
-        
-        return breakdown
+        return self._get_pile_breakdown(player.hand)
     
     def _get_pile_breakdown(self, pile: List[Card]) -> Dict:
         """Get detailed breakdown of a card pile (deck or discard)"""
-        breakdown = {
-            'energy': 0,
-            'rouleur': 0,
-            'sprinter': 0,
-            'climber': 0,
-            'total': len(pile)
-        }
-        
+        counts = [0] * len(CardType)
         for card in pile:
-            if card.card_type == CardType.ENERGY:
-                breakdown['energy'] += 1
-            elif card.card_type == CardType.ROULEUR:
-                breakdown['rouleur'] += 1
-            elif card.card_type == CardType.SPRINTER:
-                breakdown['sprinter'] += 1
-            elif card.card_type == CardType.CLIMBER:
-                breakdown['climber'] += 1
-        
+            counts[card.card_type.index] += 1
+
+        # Keys in CardType order: energy, rouleur, sprinter, climber, total
+        breakdown = {card_type.name.lower(): counts[card_type.index] for card_type in CardType}
+        breakdown['total'] = len(pile)
         return breakdown
     
     def get_card_distribution_summary(self) -> Dict:
@@ -754,6 +775,12 @@ class GameState:
         """Check if a rider has already reached this checkpoint"""
         return checkpoint in self.checkpoints_reached.get(rider, set())
     
+    def new_checkpoints(self, rider: Rider, old_position: int, new_position: int) -> List[int]:
+        """Checkpoints past old_position up to new_position that the rider hasn't reached yet"""
+        reached = self.checkpoints_reached.get(rider, ())
+        first = (max(old_position, 0) // 10 + 1) * 10
+        return [cp for cp in range(first, new_position + 1, 10) if cp not in reached]
+
     def mark_checkpoint_reached(self, rider: Rider, checkpoint: int):
         """Mark that a rider has reached a checkpoint"""
         if rider not in self.checkpoints_reached:
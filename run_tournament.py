@@ -16,12 +16,15 @@ Total: 250 games
 Results saved to: game_logs/tournament_results_TIMESTAMP.csv
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from itertools import combinations, permutations
 from simulator import GameSimulator
 from agents import create_agent
+from game_config import GameConfig, get_config, set_config
 import pandas as pd
 from datetime import datetime
 import os
+import random
 import re
 
 
@@ -37,7 +40,24 @@ def _get_winning_agent(row):
     return None
 
 
-def run_multiplayer_tournament(agent_types, games_per_combination=10):
+def _play_tournament_game(num_players, perm, game_id, seed=None, config: GameConfig = None):
+    """Play one tournament game and return its final result and turn count.
+
+    Runs in worker processes when the tournament is parallel, so it only takes
+    picklable arguments; `seed` and `config` make the worker match the parent.
+    """
+    if config is not None:
+        set_config(config)
+    if seed is not None:
+        random.seed(seed)
+
+    sim = GameSimulator(num_players=num_players, verbose=False)
+    agents = [create_agent(agent_type, player_id) for player_id, agent_type in enumerate(perm)]
+    game_log = sim.run_game(agents, game_id=game_id)
+    return game_log['final_result'], len(game_log.get('move_history', []))
+
+
+def run_multiplayer_tournament(agent_types, games_per_combination=10, n_jobs=1):
     """
     Run tournament with all combinations of agents for 2, 3, and 4 players
 
@@ -47,6 +67,11 @@ def run_multiplayer_tournament(agent_types, games_per_combination=10):
     Args:
         agent_types: List of agent type strings (e.g., ['chatgpt', 'gemini', 'claudebot'])
         games_per_combination: Number of games to run per agent combination
+        n_jobs: Number of worker processes to spread games over (None or -1 for all
+                cores). With 1 (default) games run one after another in this process.
+                Every game's seed is drawn from the global random generator before
+                any game is played, so a seeded tournament gives the same results
+                for any n_jobs.
 
     Returns:
         pandas.DataFrame with all tournament results
@@ -65,31 +90,19 @@ def run_multiplayer_tournament(agent_types, games_per_combination=10):
     all_results = []
     total_games = 0
 
-    # Run tournaments for 3 and 4 players
-    for num_players in [3, 4]:
-        print(f"\n{'='*80}")
-        print(f"{num_players}-PLAYER GAMES")
-        print(f"{'='*80}")
-
-        # Generate all combinations
-        combos = list(combinations(agent_types, num_players))
-        total_combo_games = len(combos) * games_per_combination
-        print(f"Combinations: {len(combos)}")
-        print(f"Total games: {len(combos)} × {games_per_combination} = {total_combo_games}")
-        print()
-
-        # Create simulator for this player count
-        sim = GameSimulator(num_players=num_players, verbose=False)
-
-        combo_num = 0
-        for combo in combos:
-            combo_num += 1
-            combo_str = ' vs '.join(combo)
-            print(f"[{combo_num}/{len(combos)}] {combo_str}")
-
-            # Track results for this combination
-            combo_results = []
+    if n_jobs is not None and (n_jobs == 0 or n_jobs < -1):
+        raise ValueError(f"n_jobs must be a positive number of workers, "
+                         f"or None or -1 for all cores (got {n_jobs})")
+    if n_jobs == -1:
+        n_jobs = None  # ProcessPoolExecutor uses all cores
 
+    # Plan every game before playing any, so each game's id and seed don't depend
+    # on how (or whether) earlier games were played
+    schedule = []  # (num_players, [(combo, [(perm, game_id, seed), ...]), ...])
+    next_game_id = 0
+    for num_players in [3, 4]:
+        combo_games = []
+        for combo in combinations(agent_types, num_players):
             # Generate all permutations of this combination to alternate positions
             perms = list(permutations(combo))
             num_perms = len(perms)
@@ -103,32 +116,68 @@ def run_multiplayer_tournament(agent_types, games_per_combination=10):
             for i in range(extra_games):
                 perm_game_counts[i] += 1
 
-            # Run games for each permutation
-            for perm_idx, perm in enumerate(perms):
-                for game_num in range(perm_game_counts[perm_idx]):
-                    try:
-                        # Create agents in the permuted order
-                        agents = [create_agent(agent_type, player_id)
-                                 for player_id, agent_type in enumerate(perm)]
+            # Games for each permutation, in order, with their ids and seeds
+            perm_games = [perm for perm_idx, perm in enumerate(perms)
+                          for _ in range(perm_game_counts[perm_idx])]
+            games = [(perm, next_game_id + i, random.getrandbits(64))
+                     for i, perm in enumerate(perm_games)]
+            next_game_id += len(games)
+            combo_games.append((combo, games))
+        schedule.append((num_players, combo_games))
+
+    executor = ProcessPoolExecutor(max_workers=n_jobs) if n_jobs != 1 else None
+    try:
+        # Hand every game to the workers up front so none sit idle between combinations
+        futures = {}
+        if executor is not None:
+            config = get_config()
+            for num_players, combo_games in schedule:
+                for combo, games in combo_games:
+                    for perm, game_id, seed in games:
+                        futures[game_id] = executor.submit(_play_tournament_game, num_players, perm,
+                                                           game_id, seed, config)
+
+        # Run tournaments for 3 and 4 players
+        for num_players, combo_games in schedule:
+            print(f"\n{'='*80}")
+            print(f"{num_players}-PLAYER GAMES")
+            print(f"{'='*80}")
+
+            total_combo_games = len(combo_games) * games_per_combination
+            print(f"Combinations: {len(combo_games)}")
+            print(f"Total games: {len(combo_games)} × {games_per_combination} = {total_combo_games}")
+            print()
 
-                        # Run game
-                        game_log = sim.run_game(agents, game_id=total_games)
+            for combo_num, (combo, games) in enumerate(combo_games, 1):
+                combo_str = ' vs '.join(combo)
+                print(f"[{combo_num}/{len(combo_games)}] {combo_str}")
+
+                # Track results for this combination
+                combo_results = []
+
+                for perm, game_id, seed in games:
+                    try:
+                        # Run game (in this process, or collect it from its worker)
+                        if executor is None:
+                            final_result, total_turns = _play_tournament_game(num_players, perm,
+                                                                              game_id, seed)
+                        else:
+                            final_result, total_turns = futures[game_id].result()
                         total_games += 1
 
                         # Extract results
-                        final_result = game_log['final_result']
                         final_scores = final_result['final_scores']
                         winner = final_result['winner']
                         game_over_reason = final_result.get('game_over_reason', 'unknown')
 
                         # Record result
                         result = {
-                            'game_id': total_games - 1,
+                            'game_id': game_id,
                             'num_players': num_players,
                             'combination': combo_str,
                             'winner': winner,
                             'game_over_reason': game_over_reason,
-                            'total_turns': len(game_log.get('move_history', []))
+                            'total_turns': total_turns
                         }
 
                         # Add individual player results (using permuted order)
@@ -140,14 +189,18 @@ def run_multiplayer_tournament(agent_types, games_per_combination=10):
                         combo_results.append(result)
 
                     except Exception as e:
-                        print(f"  ERROR in game {total_games}: {e}")
+                        print(f"  ERROR in game {game_id}: {e}")
                         continue
 
-            print(f"  Completed: {games_per_combination} games")
+                print(f"  Completed: {games_per_combination} games")
 
-            # Print position statistics for this combination
-            print_combination_stats(combo_results, combo, num_players)
-            print()
+                # Print position statistics for this combination
+                print_combination_stats(combo_results, combo, num_players)
+                print()
+    finally:
+        # Also stop the workers if a game or the stats printing raises
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
 
     # Create DataFrame
     df = pd.DataFrame(all_results)
@@ -646,6 +646,18 @@ class TestCardMechanics(unittest.TestCase):
         # Check if already reached
         self.assertTrue(state.has_rider_reached_checkpoint(rider, 10))
 
+    def test_new_checkpoints(self):
+        """Only checkpoints past the old position and not yet reached are new"""
+        state = GameState(num_players=2, tile_config=[1, 4, 5])
+        rider = state.players[0].riders[0]
+
+        self.assertEqual(state.new_checkpoints(rider, 0, 9), [])
+        self.assertEqual(state.new_checkpoints(rider, 5, 25), [10, 20])
+        self.assertEqual(state.new_checkpoints(rider, 10, 30), [20, 30])
+
+        state.mark_checkpoint_reached(rider, 20)
+        self.assertEqual(state.new_checkpoints(rider, 5, 25), [10])
+
 
 class TestMoveValidation(unittest.TestCase):
     """Test move validation and generation"""
@@ -738,6 +750,79 @@ class TestMoveValidation(unittest.TestCase):
         team_car_moves = [m for m in moves if m.action_type == ActionType.TEAM_CAR]
         self.assertGreater(len(team_car_moves), 0)
 
+    def test_valid_moves_carry_precomputed_attributes(self):
+        """Generated moves should carry their distance, total advancement and card type mask"""
+        state = GameState(num_players=2)
+        engine = GameEngine(state)
+
+        player = state.players[0]
+        moves = engine.get_valid_moves(player)
+
+        for move in moves:
+            self.assertEqual(move.distance, engine._calculate_move_distance(move))
+            self.assertEqual(move.advancement, engine._calculate_advancement(move))
+            expected_mask = 0
+            for card in move.cards:
+                expected_mask |= 1 << list(CardType).index(card.card_type)
+            self.assertEqual(move.card_type_mask, expected_mask)
+            if move.action_type == ActionType.TEAM_CAR:
+                self.assertEqual(move.advancement, 0)
+
+    def test_valid_moves_cached_until_turn_state_changes(self):
+        """get_valid_moves should reuse its result until hand, positions or last move change"""
+        state = GameState(num_players=2)
+        engine = GameEngine(state)
+
+        player = state.players[0]
+        rider = player.riders[0]
+
+        first = engine.get_valid_moves(player, [rider])
+        second = engine.get_valid_moves(player, [rider])
+
+        # Same moves, but a fresh list each time
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertIs(first[0], second[0])
+
+        # Changing the hand invalidates the cache
+        player.hand = [Card(CardType.ENERGY)]
+        moves = engine.get_valid_moves(player, [rider])
+        self.assertEqual(len([m for m in moves if m.action_type == ActionType.PULL]), 1)
+
+        # Moving the rider invalidates the cache
+        rider.position = 5
+        before_move = moves
+        moves = engine.get_valid_moves(player, [rider])
+        self.assertIsNot(moves[0], before_move[0])
+
+    def test_rider_moves_groups_valid_moves_by_rider(self):
+        """rider_moves should return exactly the valid moves led by that rider"""
+        state = GameState(num_players=2)
+        engine = GameEngine(state)
+
+        player = state.players[0]
+        valid_moves = engine.get_valid_moves(player)
+
+        for rider in player.riders:
+            expected = [m for m in valid_moves if m.rider == rider]
+            self.assertEqual(engine.rider_moves(player, rider), expected)
+
+        # Riders outside the eligible set have no moves
+        eligible = [player.riders[0]]
+        self.assertEqual(engine.rider_moves(player, player.riders[1], eligible), [])
+
+    def test_action_moves_groups_valid_moves_by_action_type(self):
+        """action_moves should return exactly the valid moves of that action type, in order"""
+        state = GameState(num_players=2)
+        engine = GameEngine(state)
+
+        player = state.players[0]
+        valid_moves = engine.get_valid_moves(player)
+
+        for action_type in ActionType:
+            expected = [m for m in valid_moves if m.action_type == action_type]
+            self.assertEqual(engine.action_moves(player, action_type), expected)
+
 
 class TestDraftingRules(unittest.TestCase):
     """Test drafting eligibility and rules"""
@@ -906,6 +991,40 @@ class TestSprintAndFinishScoring(unittest.TestCase):
         points2 = engine._check_sprint_scoring(rider, sprint_pos)
         self.assertEqual(points2, 0)
 
+    def test_sprint_arrival_bits_follow_arrivals(self):
+        """Each rider has its own bit, set at a field once the rider arrives there"""
+        state = GameState(num_players=3, tile_config=[1])
+        engine = GameEngine(state)
+
+        all_riders = [rider for player in state.players for rider in player.riders]
+        self.assertEqual(len({rider.bit for rider in all_riders}), len(all_riders))
+
+        first, second = state.players[0].riders[1], state.players[2].riders[0]
+        engine._check_sprint_scoring(first, 19)
+        engine._check_sprint_scoring(second, 19)
+        engine._check_sprint_scoring(first, 19)
+
+        self.assertEqual(state.sprint_arrivals[19], [first, second])
+        self.assertEqual(state.sprint_arrival_bits[19], first.bit | second.bit)
+
+    def test_sprint_points_won_matches_awarded_points(self):
+        """Agents' point estimate follows arrival order and skips riders already scored"""
+        from agents import sprint_points_won
+
+        state = GameState(num_players=2, tile_config=[1])
+        engine = GameEngine(state)
+
+        finish_pos = 19
+        first, second = state.players[0].riders[0], state.players[1].riders[0]
+
+        self.assertEqual(sprint_points_won(state, first, 15, finish_pos), 12)
+        self.assertEqual(sprint_points_won(state, first, 15, finish_pos, finish_weight=3.0), 36)
+        engine._check_sprint_scoring(first, finish_pos)
+
+        self.assertEqual(sprint_points_won(state, first, 15, finish_pos), 0)
+        self.assertEqual(sprint_points_won(state, second, 15, finish_pos), 8)
+        self.assertEqual(sprint_points_won(state, second, 15, finish_pos - 1), 0)
+
     def test_sprint_arrival_order_tracking(self):
         """Sprint arrivals should be tracked in order"""
         state = GameState(num_players=3, tile_config=[1])
@@ -1117,6 +1236,53 @@ class TestTeamCarAction(unittest.TestCase):
         self.assertTrue(result['success'])
         self.assertEqual(len(result['cards_drawn']), 2)
 
+    def test_team_car_move_if_needed(self):
+        """TeamCar is suggested only for a low hand with no draft available"""
+        state = GameState(num_players=2)
+        engine = GameEngine(state)
+
+        player = state.players[0]
+        rider = player.riders[0]
+
+        # Full hand: no need for TeamCar
+        self.assertIsNone(engine.team_car_move_if_needed(player, [rider]))
+
+        # Low hand, nothing to draft: TeamCar
+        player.hand = [Card(CardType.ENERGY)]
+        move = engine.team_car_move_if_needed(player, [rider])
+        self.assertEqual(move.action_type, ActionType.TEAM_CAR)
+        self.assertIs(move.rider, rider)
+
+        # Low hand, but a free draft is available: keep the draft option
+        state.last_move = {'action': 'Pull', 'rider': 'P1R0', 'old_position': rider.position, 'movement': 3}
+        self.assertIsNone(engine.team_car_move_if_needed(player, [rider]))
+        self.assertEqual(engine.team_car_move(player, [rider]).action_type, ActionType.TEAM_CAR)
+
+    def test_get_low_hand_move(self):
+        """A low hand plays a draft if one is available, otherwise TeamCar"""
+        from agents import get_low_hand_move
+
+        state = GameState(num_players=2)
+        engine = GameEngine(state)
+
+        player = state.players[0]
+        rider = player.riders[0]
+
+        # Full hand: no low-hand move
+        valid_moves = engine.get_valid_moves(player, [rider])
+        self.assertIsNone(get_low_hand_move(engine, player, valid_moves, [rider]))
+
+        # Low hand, nothing to draft: TeamCar
+        player.hand = [Card(CardType.ENERGY)]
+        valid_moves = engine.get_valid_moves(player, [rider])
+        self.assertEqual(get_low_hand_move(engine, player, valid_moves, [rider]).action_type,
+                         ActionType.TEAM_CAR)
+
+        # Low hand with a draft available: the draft
+        state.last_move = {'action': 'Pull', 'rider': 'P1R0', 'old_position': rider.position, 'movement': 3}
+        valid_moves = engine.get_valid_moves(player, [rider])
+        self.assertEqual(get_low_hand_move(engine, player, valid_moves, [rider]).action_type, ActionType.DRAFT)
+
     def test_team_car_discards_one_card(self):
         """TeamCar should discard 1 card"""
         state = GameState(num_players=2)
@@ -1183,6 +1349,27 @@ class TestTrackConfiguration(unittest.TestCase):
         first_tile_last = state.track[19]
         self.assertEqual(first_tile_last.terrain, TerrainType.SPRINT)
 
+    def test_scoring_positions(self):
+        """scoring_positions lists the sprint and finish fields in track order"""
+        state = GameState(num_players=2, tile_config=[1, 2, 3])
+
+        self.assertEqual(state.scoring_positions, [19, 39, 59])
+        self.assertEqual(state.scoring_positions_crossed(15, 39), [19, 39])
+        self.assertEqual(state.scoring_positions_crossed(19, 38), [])
+
+    def test_riders_by_position_matches_per_position_lookup(self):
+        """get_riders_by_position groups riders exactly like get_riders_at_position"""
+        state = GameState(num_players=3)
+        state.players[0].riders[1].position = 4
+        state.players[2].riders[0].position = 4
+        state.players[1].riders[2].position = 9
+
+        riders_by_position = state.get_riders_by_position()
+
+        self.assertEqual(sorted(riders_by_position), [0, 4, 9])
+        for position, riders in riders_by_position.items():
+            self.assertEqual(riders, state.get_riders_at_position(position))
+
 
 class TestTobiBotAgent(unittest.TestCase):
     """Test TobiBot agent's prioritized decision-making system"""
@@ -1384,6 +1571,60 @@ class TestTobiBotAgent(unittest.TestCase):
         # Should detect that sprint points are available
         self.assertGreaterEqual(points, 0)
 
+    def test_scoring_moves_by_points_matches_per_move_points(self):
+        """Shared points lookups give each move the points it scores on its own"""
+        from agents import scoring_moves_by_points
+
+        self.player.riders[0].position = 17
+        self.player.hand = [Card(CardType.ROULEUR, 5) for _ in range(3)]
+        valid_moves = self.engine.get_valid_moves(self.player)
+
+        scoring_moves, points = scoring_moves_by_points(valid_moves, self.engine, self.tobibot._calculate_points)
+
+        expected = [m for m in valid_moves
+                    if m.action_type != ActionType.TEAM_CAR and self.tobibot._calculate_points(m, self.engine) > 0]
+        self.assertEqual(scoring_moves, expected)
+        self.assertTrue(scoring_moves)
+        for move in scoring_moves:
+            self.assertEqual(points[id(move)], self.tobibot._calculate_points(move, self.engine))
+
+    def test_has_efficient_move_matches_per_card_ratio(self):
+        """The efficiency gate matches the >=1 field per card check on each move"""
+        from agents import calculate_total_advancement, has_efficient_move
+
+        self.player.hand = [Card(CardType.ROULEUR, 5) for _ in range(3)]
+        valid_moves = self.engine.get_valid_moves(self.player)
+
+        def efficient(move):
+            advancement = calculate_total_advancement(self.engine, move)
+            if move.action_type == ActionType.TEAM_CAR or advancement == 0:
+                return False
+            return not move.cards or advancement / len(move.cards) >= 1
+
+        self.assertEqual(has_efficient_move(valid_moves), any(map(efficient, valid_moves)))
+        team_car = [m for m in valid_moves if m.action_type == ActionType.TEAM_CAR]
+        self.assertFalse(has_efficient_move(team_car))
+
+    def test_turn_context_groups_productive_moves(self):
+        """TurnContext groups the non-TeamCar moves that advance, keeping their order"""
+        from agents import TurnContext, calculate_total_advancement
+
+        self.player.hand = [Card(CardType.ROULEUR, 5) for _ in range(3)]
+        valid_moves = self.engine.get_valid_moves(self.player)
+        ctx = TurnContext(self.engine, self.player, valid_moves)
+
+        expected = [m for m in valid_moves
+                    if m.action_type != ActionType.TEAM_CAR and calculate_total_advancement(self.engine, m) > 0]
+        self.assertEqual(ctx.productive_moves, expected)
+        for action_type in ActionType:
+            self.assertEqual(ctx.productive(action_type),
+                             [m for m in expected if m.action_type == action_type])
+        self.assertEqual(ctx.riders_by_position, self.state.get_riders_by_position())
+        own_by_pos, opp_by_pos = ctx.riders_by_side
+        for pos, riders in self.state.get_riders_by_position().items():
+            self.assertEqual(own_by_pos.get(pos, []), [r for r in riders if r.player_id == self.player.player_id])
+            self.assertEqual(opp_by_pos.get(pos, []), [r for r in riders if r.player_id != self.player.player_id])
+
     def test_tobibot_respects_terrain_limits(self):
         """Test that TobiBot respects terrain limits in calculations"""
         # Use a track with climbs
@@ -1691,6 +1932,35 @@ class TestTournamentPositionAlternation(unittest.TestCase):
             self.assertEqual(total_games, 10,
                            f"{agent} should play 10 total games, got {total_games}")
 
+    def test_parallel_tournament_matches_serial(self):
+        """A seeded tournament gives the same results with worker processes"""
+        from run_tournament import run_multiplayer_tournament
+        from pandas.testing import assert_frame_equal
+        import random
+
+        # Several combinations, so a later combination's seeds depend on earlier ones being played
+        agents = ['random', 'marc_soler', 'wheelsucker', 'gemini']
+        results = []
+        for n_jobs in (1, 2):
+            random.seed(7)
+            df, _ = run_multiplayer_tournament(
+                agent_types=agents,
+                games_per_combination=2,
+                n_jobs=n_jobs
+            )
+            results.append(df)
+
+        self.assertEqual(len(results[0]), 10)
+        assert_frame_equal(results[0], results[1])
+
+    def test_invalid_n_jobs_is_rejected(self):
+        """n_jobs must be a worker count, or None/-1 for all cores"""
+        from run_tournament import run_multiplayer_tournament
+
+        for n_jobs in (0, -2):
+            with self.assertRaises(ValueError):
+                run_multiplayer_tournament(['random', 'marc_soler'], games_per_combination=1, n_jobs=n_jobs)
+
     def test_analyze_position_bias_function(self):
         """Test the analyze_position_bias function"""
         from run_tournament import run_multiplayer_tournament, analyze_position_bias
@@ -1743,6 +2013,122 @@ class TestAgentWastefulMoves(unittest.TestCase):
         self.assertTrue(result, "Some agents chose wasteful moves (cost cards but 0 advancement)")
 
 
+class TestAgentFactory(unittest.TestCase):
+    """Test agent creation"""
+
+    def test_agents_are_picklable(self):
+        """Factory entries and agents must pickle so games can run in worker processes"""
+        import pickle
+        from agents import create_agent, get_available_agents
+
+        for agent_type in get_available_agents():
+            agent = pickle.loads(pickle.dumps(create_agent(agent_type, 1)))
+            self.assertEqual(agent.player_id, 1)
+
+    def test_unknown_agent_type(self):
+        """Unknown agent types are rejected"""
+        from agents import create_agent
+
+        with self.assertRaises(ValueError):
+            create_agent('no_such_agent', 0)
+
+    def test_seeded_random_agent_is_reproducible(self):
+        """Random agents with the same seed make the same choices"""
+        from agents import RandomAgent
+
+        state = GameState(num_players=2)
+        engine = GameEngine(state)
+        player = state.players[0]
+
+        choices = []
+        for _ in range(2):
+            agent = RandomAgent(0, seed=42)
+            choices.append([agent.choose_move(engine, player) for _ in range(5)])
+
+        self.assertEqual(choices[0], choices[1])
+
+
+class TestAlphaBetaAgent(unittest.TestCase):
+    """Test the look-ahead search agent"""
+
+    def setUp(self):
+        from agents import create_agent
+        self.state = GameState(num_players=2)
+        self.engine = GameEngine(self.state)
+        self.agent = create_agent('alphabeta', 0)
+
+    def test_chooses_valid_move_without_changing_state(self):
+        """Search runs on copies: the real state and random stream are untouched"""
+        import random
+        turn_player, eligible = self.state.determine_next_turn()
+        positions = [r.position for p in self.state.players for r in p.riders]
+        hand = list(turn_player.hand)
+        deck = list(self.state.deck)
+        random_state = random.getstate()
+
+        agent = self.agent if turn_player.player_id == 0 else type(self.agent)(turn_player.player_id)
+        move = agent.choose_move(self.engine, turn_player, eligible)
+
+        self.assertIn(move, self.engine.get_valid_moves(turn_player, eligible))
+        self.assertEqual(positions, [r.position for p in self.state.players for r in p.riders])
+        self.assertEqual(hand, turn_player.hand)
+        self.assertEqual(deck, self.state.deck)
+        self.assertEqual(random_state, random.getstate())
+
+    def test_transposition_table_is_cleared_each_turn(self):
+        """Entries from an earlier turn's search are never reused"""
+        player, eligible = self.state.determine_next_turn()
+        agent = type(self.agent)(player.player_id)
+
+        first = agent.choose_move(self.engine, player, eligible)
+        table_size = len(agent._transpositions)
+        agent._transpositions['stale'] = (0.0, agent.EXACT)
+        second = agent.choose_move(self.engine, player, eligible)
+
+        self.assertGreater(table_size, 0)
+        self.assertNotIn('stale', agent._transpositions)
+        self.assertEqual(len(agent._transpositions), table_size)
+        self.assertEqual(first, second)
+
+    def test_free_draft_is_always_searched(self):
+        """Move ordering keeps a free draft in the beam ahead of card-hungry moves"""
+        player = self.state.players[0]
+        rider = player.riders[0]
+        rider.position = 5
+        self.state.last_move = {'action': 'Pull', 'rider': 'P1R0', 'old_position': 5, 'movement': 2}
+
+        valid_moves = self.engine.get_valid_moves(player, [rider])
+        searched = self.agent._ordered_moves(valid_moves, self.engine)
+
+        self.assertLessEqual(len(searched), self.agent.beam_width + 3)
+        self.assertIn(ActionType.DRAFT, [m.action_type for m in searched])
+
+    def test_opponent_hands_are_dealt_from_unseen_cards(self):
+        """The search copy keeps our hand but redeals opponents' hands from the unseen cards"""
+        own_hand = list(self.state.players[0].hand)
+        opponent = self.state.players[1]
+        hand_size = len(opponent.hand)
+        unseen = sorted(map(id, self.state.deck + opponent.hand))
+
+        self.agent._deal_unseen_cards(self.state)
+
+        self.assertEqual(own_hand, self.state.players[0].hand)
+        self.assertEqual(hand_size, len(opponent.hand))
+        self.assertEqual(unseen, sorted(map(id, self.state.deck + opponent.hand)))
+
+    def test_evaluation_finds_players_by_id(self):
+        """Evaluation doesn't rely on list order and copes without opponents"""
+        own, opponent = self.state.players
+        own.points = 2
+        expected = self.agent._player_value(own) - self.agent._player_value(opponent)
+
+        self.state.players = [opponent, own]
+        self.assertEqual(expected, self.agent._evaluate(self.state))
+
+        self.state.players = [own]
+        self.assertEqual(self.agent._player_value(own), self.agent._evaluate(self.state))
+
+
 if __name__ == '__main__':
     # Reset to default config so tests aren't affected by config.json
     set_config(GameConfig())